@@ -20,7 +20,7 @@ class WsLinkSession:
     CLIENT_ERROR = -32099
     AUTH_ID = "system:c0:0"
 
-    def __init__(self, ws):
+    def __init__(self, ws, max_in_flight=None, timeout=None):
         self.loop = asyncio.get_running_loop()
         self.attachment_atomic = asyncio.Lock()
         self.ws = ws
@@ -30,6 +30,12 @@ class WsLinkSession:
         self.client_id = None
         self.unchunker = UnChunker()
         self.in_flight_rpc = {}
+        self.timeout = timeout
+        self._in_flight_slots = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        )
+        self._outgoing = []
+        self._send_task = None
 
     async def on_msg_complete(self, payload):
         # Notification-only message from the server - should be binary attachment header
@@ -42,14 +48,14 @@ class WsLinkSession:
 
         # Error
         if "error" in payload:
-            if future:
+            if future and not future.done():
                 future.set_exception(
                     payload.get("error", "Server error")
                 )  # May need to wrap in Exception?
             else:
                 print("Server error:", payload.get("error"))
 
-            self.in_flight_rpc.pop(msg_id)
+            self.in_flight_rpc.pop(msg_id, None)
             return
 
         # Normal processing
@@ -57,7 +63,7 @@ class WsLinkSession:
 
         # RPC
         if msg_type == "rpc":
-            if future:
+            if future and not future.done():
                 future.set_result(msg_result)
 
         # Publish
@@ -81,9 +87,22 @@ class WsLinkSession:
 
         # Clean pending future
         if future:
-            self.in_flight_rpc.pop(msg_id)
+            self.in_flight_rpc.pop(msg_id, None)
+
+    def abort_pending(self, error):
+        """Fail every call still waiting for a response"""
+        pending, self.in_flight_rpc = self.in_flight_rpc, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
 
     async def listen(self):
+        try:
+            await self._listen()
+        finally:
+            self.abort_pending(ConnectionError("Connection to server lost"))
+
+    async def _listen(self):
         async for msg in self.ws:
             if msg.type == aiohttp.WSMsgType.CLOSE:
                 print("CLOSE")
@@ -111,25 +130,34 @@ class WsLinkSession:
             "kwargs": {},
         }
         self.in_flight_rpc[key] = resp
+        await self._send(wrapper)
+        return resp
 
-        try:
-            packed_wrapper = msgpack.packb(wrapper)
-        except Exception:
-            del wrapper["error"]["data"]
-            packed_wrapper = msgpack.packb(wrapper)
+    async def call(self, method, args=None, kwargs=None, timeout=None):
+        """
+        Send a RPC and return the future of its result.
 
-        async with self.attachment_atomic:
-            for chunk in generate_chunks(packed_wrapper, MAX_MSG_SIZE):
-                if self.ws is not None:
-                    await self.ws.send_bytes(chunk)
+        Messages queued during the same loop iteration get sent together.
+        When the session has a max_in_flight limit, this waits for a slot.
 
-        return resp
+        :param timeout: Seconds after which the future fails with a
+                        TimeoutError (default: session timeout)
+        """
+        if self._in_flight_slots is not None:
+            await self._in_flight_slots.acquire()
 
-    async def call(self, method, args=None, kwargs=None):
         self.msg_count += 1
         key = f"rpc:{self.client_id}:{self.msg_count}"
         resp = self.loop.create_future()
         self.in_flight_rpc[key] = resp
+        if self._in_flight_slots is not None:
+            resp.add_done_callback(self._release_slot)
+
+        timeout = self.timeout if timeout is None else timeout
+        if timeout:
+            handle = self.loop.call_later(timeout, self._expire, key)
+            resp.add_done_callback(lambda _: handle.cancel())
+
         if args is None:
             args = []
         if kwargs is None:
@@ -143,19 +171,50 @@ class WsLinkSession:
             "kwargs": kwargs,
         }
 
+        try:
+            await self._send(wrapper)
+        except Exception as e:
+            self.in_flight_rpc.pop(key, None)
+            if not resp.done():
+                resp.set_exception(e)
+            raise
+
+        return resp
+
+    def _release_slot(self, _future):
+        self._in_flight_slots.release()
+
+    def _expire(self, key):
+        future = self.in_flight_rpc.pop(key, None)
+        if future is not None and not future.done():
+            msg = f"No response for {key}"
+            future.set_exception(asyncio.TimeoutError(msg))
+
+    async def _send(self, wrapper):
+        """Queue a message and wait for the batch holding it to be sent"""
         try:
             packed_wrapper = msgpack.packb(wrapper)
         except Exception:
             del wrapper["error"]["data"]
             packed_wrapper = msgpack.packb(wrapper)
 
+        self._outgoing.extend(generate_chunks(packed_wrapper, MAX_MSG_SIZE))
+        if self._send_task is None:
+            self._send_task = self.loop.create_task(self._send_outgoing())
+
+        # Don't abort the batch when a single caller gets cancelled
+        await asyncio.shield(self._send_task)
+
+    async def _send_outgoing(self):
+        # Let the other calls of this loop iteration join the batch
+        await asyncio.sleep(0)
         async with self.attachment_atomic:
-            for chunk in generate_chunks(packed_wrapper, MAX_MSG_SIZE):
+            chunks, self._outgoing = self._outgoing, []
+            self._send_task = None
+            for chunk in chunks:
                 if self.ws is not None:
                     await self.ws.send_bytes(chunk)
 
-        return resp
-
     def register_subscription(self, topic, callback):
         if topic not in self.subscriptions:
             self.subscriptions[topic] = [callback]
@@ -184,14 +243,60 @@ class Client:
     """
     Client implementation for driving a remote trame server with its shared state and
     trigger method calls in plain python.
+
+    With reconnect=True, `connect` keeps the client connected until `disconnect`
+    is called. A dropped connection is retried with an exponential backoff, then
+    the client authenticates again, restores its subscriptions and resyncs its
+    state from the server before the state changes and trigger calls made in
+    the meantime are sent.
+
+    :param url: Websocket url of the server (ws://host:port/ws)
+    :param config: Authentication parameters (e.g. secret)
+    :param reconnect: Reconnect automatically when the connection drops
+    :param retry_delay: Delay in seconds before the first reconnection attempt
+    :param max_retry_delay: Upper bound of the exponential backoff delay
+    :param max_retries: Number of consecutive failed attempts before giving up
+                        (default: never give up)
+    :param max_in_flight: Maximum number of calls waiting for a response,
+                          further calls wait for a slot (default: no limit)
+    :param call_timeout: Seconds after which a call without response fails
+                         with a TimeoutError (default: no timeout)
     """
 
-    def __init__(self, url=None, config=None, translator=None, hot_reload=False):
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    RECONNECTING = 3
+
+    def __init__(
+        self,
+        url=None,
+        config=None,
+        translator=None,
+        hot_reload=False,
+        reconnect=False,
+        retry_delay=0.5,
+        max_retry_delay=30,
+        max_retries=None,
+        max_in_flight=None,
+        call_timeout=None,
+    ):
         # Network
-        self._connected = 0
+        self._connected = Client.DISCONNECTED
         self._session = None
         self._url = url
         self._config = {} if config is None else config
+        self._reconnect = reconnect
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._max_retries = max_retries
+        self._max_in_flight = max_in_flight
+        self._call_timeout = call_timeout
+        self._subscriptions = {}
+        self._connection_callbacks = []
+        self._offline_changes = {}
+        self._ready = None
+        self._stop = None
 
         # fake server
         self.hot_reload = hot_reload
@@ -205,32 +310,143 @@ class Client:
     async def connect(self, url=None, **kwargs):
         if self._connected:
             return
-        self._connected = 1
 
         config = {**self._config, **kwargs}
         if url is None:
             url = self._url
 
-        async with aiohttp.ClientSession() as session:
-            async with session.ws_connect(url) as ws:
-                self._session = WsLinkSession(ws)
-                self._state.ready()
-                self._session.register_subscription(
-                    "trame.state.topic", self._on_state_update
-                )
-                self._connected = 2
-                task = asynchronous.create_task(self._session.listen())
-                await self._session.auth(**config)
-                await task
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._set_connection_status(Client.CONNECTING)
 
-        self._session.clear_subscriptions()
-        self._session = None
-        self._connected = 0
+        failures = 0
+        try:
+            while not self._stop.is_set():
+                try:
+                    if await self._run_session(url, config):
+                        failures = 0
+                except (aiohttp.ClientError, OSError) as e:
+                    if not self._reconnect:
+                        raise
+                    failures += 1
+                    logger.warning("Connection to %s failed: %s", url, e)
+
+                if not self._reconnect or self._stop.is_set():
+                    break
+
+                if self._max_retries is not None and failures >= self._max_retries:
+                    logger.error("Giving up reconnecting to %s", url)
+                    break
+
+                self._set_connection_status(Client.RECONNECTING)
+                delay = min(self._max_retry_delay, self._retry_delay * 2**failures)
+                try:
+                    await asyncio.wait_for(self._stop.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._set_connection_status(Client.DISCONNECTED)
+
+    async def _run_session(self, url, config):
+        """
+        Run a single websocket session until it closes.
+        Return True if the session got established.
+        """
+        established = False
+        async with aiohttp.ClientSession() as session, session.ws_connect(url) as ws:
+            self._session = WsLinkSession(
+                ws, max_in_flight=self._max_in_flight, timeout=self._call_timeout
+            )
+            self._state.ready()
+            self._session.register_subscription(
+                "trame.state.topic", self._on_state_update
+            )
+            for topic, callbacks in self._subscriptions.items():
+                for callback in callbacks:
+                    self._session.register_subscription(topic, callback)
+
+            task = asynchronous.create_task(self._session.listen())
+            try:
+                await (await self._session.auth(**config))
+                await self._resync()
+                established = True
+                self._set_connection_status(Client.CONNECTED)
+                self._ready.set()
+                await task
+            except ConnectionError:
+                # Connection dropped before the session was fully setup
+                await task
+            finally:
+                self._ready.clear()
+                self._session.clear_subscriptions()
+                self._session = None
+
+        return established
+
+    async def _resync(self):
+        """Catch up with the server state and send the changes made offline"""
+        response = await self._session.call("trame.state.get")
+        server_state = (await response).get("state", {})
+        offline_changes, self._offline_changes = self._offline_changes, {}
+        self._on_state_update(
+            {k: v for k, v in server_state.items() if k not in offline_changes}
+        )
+        if offline_changes:
+            self._push_state(offline_changes)
 
     async def disconnect(self):
+        if self._stop is not None:
+            self._stop.set()
         if self._session:
             await self._session.close()
 
+    # -----------------------------------------------------
+    # Connection status
+    # -----------------------------------------------------
+
+    def on_connection_change(self, callback):
+        """
+        Register a function called with the new status (Client.DISCONNECTED,
+        CONNECTING, CONNECTED or RECONNECTING) every time it changes.
+        CONNECTED is reported once authenticated and synchronized.
+        Can be used as a decorator.
+        """
+        self._connection_callbacks.append(callback)
+        return callback
+
+    def _set_connection_status(self, status):
+        if self._connected == status:
+            return
+
+        self._connected = status
+        for callback in self._connection_callbacks:
+            try:
+                callback(status)
+            except Exception:
+                logger.exception("Connection callback error")
+
+    # -----------------------------------------------------
+    # Subscriptions
+    # -----------------------------------------------------
+
+    def subscribe(self, topic, callback):
+        """
+        Call callback(event) for every message published on topic.
+        Subscriptions are restored after a reconnection.
+        """
+        self._subscriptions.setdefault(topic, []).append(callback)
+        if self._session:
+            self._session.register_subscription(topic, callback)
+
+    def unsubscribe(self, topic, callback):
+        callbacks = self._subscriptions.get(topic, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self._subscriptions.pop(topic, None)
+        if self._session:
+            self._session.unregister_subscription(topic, callback)
+
     # -----------------------------------------------------
     # Fake server for state
     # -----------------------------------------------------
@@ -261,6 +477,9 @@ class Client:
                 else:
                     delta.append({"key": key, "value": value})
             asynchronous.create_task(self._session.call("trame.state.update", [delta]))
+        elif self._reconnect:
+            # Sent once connected again
+            self._offline_changes.update(state)
 
     def _on_state_update(self, modified_state):
         with self.state:
@@ -276,12 +495,17 @@ class Client:
     def state(self):
         return self._state
 
-    async def call_trigger(self, name, args=None, kwargs=None):
+    async def call_trigger(self, name, args=None, kwargs=None, timeout=None):
         if args is None:
             args = []
 
         if kwargs is None:
             kwargs = {}
 
-        response = await self._session.call("trame.trigger", [name, args, kwargs])
+        if self._reconnect and self._ready is not None:
+            await self._ready.wait()
+
+        response = await self._session.call(
+            "trame.trigger", [name, args, kwargs], timeout=timeout
+        )
         return await response
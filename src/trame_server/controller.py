@@ -1,10 +1,13 @@
+import asyncio
+import inspect
 import logging
 import types
 import weakref
 
-from .utils import asynchronous, is_dunder, share
+from .utils import asynchronous, is_dunder, share, tracing
 from .utils.hot_reload import reload
-from .utils.namespace import Translator
+from .utils.namespace import NamespaceIndex, Translator
+from .utils.ordered_set import OrderedSet
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +16,8 @@ def _add_trigger_name(func, name):
     if isinstance(func, types.MethodType):
         _class = func.__self__.__class__
         if hasattr(_class, "_trame_trigger_method_names"):
-            _class._trame_trigger_method_names.append(func.__name__)
+            if func.__name__ not in _class._trame_trigger_method_names:
+                _class._trame_trigger_method_names.append(func.__name__)
         else:
             _class._trame_trigger_method_names = [func.__name__]
     else:
@@ -21,11 +25,229 @@ def _add_trigger_name(func, name):
 
 
 def _safe_call(f, *args, **kwargs):
-    return (
-        f() and f()(*args, **kwargs)
-        if isinstance(f, weakref.WeakMethod)
-        else f(*args, **kwargs)
-    )
+    if isinstance(f, weakref.ref):
+        f = f()
+        if f is None:
+            return None
+    return f(*args, **kwargs)
+
+
+def _weak_ref(func, callback=None):
+    """Weak reference to a function or a bound method"""
+    if isinstance(func, weakref.ref):
+        return func
+    if isinstance(func, types.MethodType):
+        return weakref.WeakMethod(func, callback)
+    return weakref.ref(func, callback)
+
+
+def _weak_key(func):
+    """Key under which a function registered with weak=True is stored"""
+    if isinstance(func, (types.FunctionType, types.MethodType)):
+        return _weak_ref(func)
+    return None
+
+
+def _registered_key(funcs, func):
+    """Return how func is stored in funcs (itself or its weak key)"""
+    if func not in funcs:
+        key = _weak_key(func)
+        if key is not None and key in funcs:
+            return key
+    return func
+
+
+def _cancel_scheduled(funcs, key):
+    """Drop the pending call of the member stored under key if scheduled"""
+    member = funcs.get(key)
+    if isinstance(member, _ScheduledCall):
+        member.cancel()
+
+
+def _deref(func):
+    return func() if isinstance(func, weakref.ref) else func
+
+
+class _ExecutionPlan:
+    """Snapshot of the functions a ControllerFunction needs to execute"""
+
+    __slots__ = ("func", "funcs", "hot_reload", "single", "task_funcs")
+
+    def __init__(self, func, funcs, task_funcs, hot_reload):
+        self.func = func
+        self.funcs = funcs
+        self.task_funcs = task_funcs
+        self.hot_reload = hot_reload
+        self.single = (
+            func is not None and not funcs and not task_funcs and not hot_reload
+        )
+
+
+class CallResult:
+    """
+    Outcome of a single member execution within ControllerFunction.call_async
+
+    :param func: The function that was executed
+    :param task: True if the function was registered with add_task
+    """
+
+    __slots__ = ("error", "func", "task", "value")
+
+    def __init__(self, func, task=False):
+        self.func = func
+        self.task = task
+        self.value = None
+        self.error = None
+
+    @property
+    def ok(self):
+        """True if the function completed without error"""
+        return self.error is None
+
+    @property
+    def timed_out(self):
+        """True if the function did not complete before the timeout"""
+        return isinstance(self.error, asyncio.TimeoutError)
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"CallResult({self.func!r}, error={self.error!r})"
+        return f"CallResult({self.func!r}, value={self.value!r})"
+
+
+async def _await_member(result, awaitable, semaphore):
+    try:
+        if semaphore is None:
+            result.value = await awaitable
+        else:
+            async with semaphore:
+                result.value = await awaitable
+    except asyncio.CancelledError:
+        # Prevent "never awaited" warning when cancelled before its turn
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    except Exception as e:  # pylint: disable=broad-except
+        result.error = e
+
+
+async def _await_members(results, awaitables, timeout=None, limit=None):
+    """Await the (result, awaitable) pairs and fill their results"""
+    if not awaitables:
+        return results
+
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    tasks = [
+        asyncio.ensure_future(_await_member(result, awaitable, semaphore))
+        for result, awaitable in awaitables
+    ]
+    try:
+        await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+    for (result, _), task in zip(awaitables, tasks):
+        if task.cancelled():
+            result.error = asyncio.TimeoutError()
+
+    return results
+
+
+class _ScheduledCall:
+    """
+    Coalesce calls to a function on the asyncio loop.
+
+    With a debounce delay the function only runs once no new call happened
+    for that delay. With a throttle frequency the function runs at most that
+    many times per second (first call immediately, then at the end of each
+    period). In both cases the arguments of the latest call are used.
+
+    Equality and hash are delegated to the wrapped function so it can still
+    be discarded or removed using the original function.
+    """
+
+    __slots__ = ("_args", "_handle", "_last_run", "debounce", "func", "interval")
+
+    def __init__(self, func, debounce=None, throttle_hz=None):
+        if (debounce is None) == (throttle_hz is None):
+            msg = "Either debounce or throttle_hz must be provided"
+            raise ValueError(msg)
+        self.func = func
+        self.debounce = debounce
+        self.interval = None if throttle_hz is None else 1.0 / throttle_hz
+        self._args = None
+        self._handle = None
+        self._last_run = None
+
+    def __call__(self, *args, **kwargs):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to schedule on, just execute
+            return _safe_call(self.func, *args, **kwargs)
+
+        self._args = (args, kwargs)
+        if self.debounce is not None:
+            if self._handle is not None:
+                self._handle.cancel()
+            self._handle = loop.call_later(self.debounce, self.flush)
+        elif self._handle is None:
+            now = loop.time()
+            if self._last_run is None or now - self._last_run >= self.interval:
+                self.flush()
+            else:
+                self._handle = loop.call_at(self._last_run + self.interval, self.flush)
+
+        return None
+
+    @property
+    def pending(self):
+        """True if a call is waiting to be executed"""
+        return self._args is not None
+
+    def flush(self):
+        """Execute the pending call now if any"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._args is None:
+            return
+
+        args, kwargs = self._args
+        self._args = None
+        try:
+            self._last_run = asyncio.get_running_loop().time()
+        except RuntimeError:
+            self._last_run = None
+
+        try:
+            result = _safe_call(self.func, *args, **kwargs)
+            if inspect.isawaitable(result):
+                asynchronous.create_task(result)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error while executing %r", self.func)
+
+    def cancel(self):
+        """Drop the pending call if any"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._args = None
+
+    def __eq__(self, other):
+        if isinstance(other, _ScheduledCall):
+            return self.func == other.func
+        return self.func == other
+
+    def __hash__(self):
+        return hash(self.func)
+
+    def __repr__(self):
+        return f"_ScheduledCall({self.func!r})"
 
 
 class TriggerCounter:
@@ -76,22 +298,39 @@ class Controller:
             "_triggers_name_id", share(internal, "_triggers_name_id", TriggerCounter())
         )
         super().__setattr__("_func_dict", share(internal, "_func_dict", {}))
+        super().__setattr__(
+            "_namespace_triggers",
+            share(internal, "_namespace_triggers", NamespaceIndex()),
+        )
+        super().__setattr__(
+            "_namespace_funcs", share(internal, "_namespace_funcs", NamespaceIndex())
+        )
 
-    def trigger(self, name):
+    def trigger(self, name, weak=False):
         """
         Use as decorator `@server.trigger(name)` so the decorated function
         will be able to be called from the client by doing `click="trigger(name)"`.
 
         :param name: A name to use for that trigger
         :type name: str
+        :param weak: Only keep a weak reference to the function so its owner
+                     can be garbage collected. The trigger automatically
+                     get unregistered once the function is gone.
+        :type weak: bool
         """
         if not name.startswith("trigger__"):
             name = self._translator.translate_key(name)
 
         def register_trigger(func):
             logger.info("trigger(%s)", name)
-            self._triggers[name] = func
-            self._triggers_fn2name[func] = name
+            entry = func
+            if weak:
+                entry = _weak_ref(
+                    func, lambda ref: self._discard_dead_trigger(name, ref)
+                )
+            self._triggers[name] = entry
+            self._triggers_fn2name[entry] = name
+            self._namespace_triggers.add(self._translator.prefix, name)
 
             # Add annotation to function
             _add_trigger_name(func, name)
@@ -100,19 +339,24 @@ class Controller:
 
         return register_trigger
 
-    def trigger_name(self, fn):
+    def trigger_name(self, fn, weak=False):
         """
         Given a function this method will register a trigger and returned its name.
         If manually registered, the given name at the time will be returned.
 
+        :param weak: Register the function with a weak reference if not
+                     already registered
+        :type weak: bool
+
         :return: The trigger name for that function
         :rtype: str
         """
-        if fn in self._triggers_fn2name:
-            return self._triggers_fn2name[fn]
+        key = self._trigger_key(fn)
+        if key is not None:
+            return self._triggers_fn2name[key]
 
         name = f"trigger__{self._triggers_name_id.next()}"
-        self.trigger(name)(fn)
+        self.trigger(name, weak=weak)(fn)
         return name
 
     def trigger_fn(self, name):
@@ -122,25 +366,40 @@ class Controller:
         :return: The trigger function for that name
         :rtype: function
         """
-        return self._triggers.get(name)
+        return _deref(self._triggers.get(name))
 
     def trigger_unregister(self, fn_or_name):
         """
         Given a trigger name or function, unregister it.
         Return the mapped name or function or False if not found.
         """
-        if fn_or_name in self._triggers_fn2name:
-            name = self._triggers_fn2name.pop(fn_or_name, None)
+        key = self._trigger_key(fn_or_name)
+        if key is not None:
+            name = self._triggers_fn2name.pop(key, None)
             self._triggers.pop(name, None)
             return name
 
         if fn_or_name in self._triggers:
             fn = self._triggers.pop(fn_or_name, None)
             self._triggers_fn2name.pop(fn, None)
-            return fn
+            return _deref(fn)
 
         return False
 
+    def _trigger_key(self, fn):
+        """Return the key used in _triggers_fn2name for fn or None"""
+        if fn in self._triggers_fn2name:
+            return fn
+        key = _weak_key(fn)
+        if key is not None and key in self._triggers_fn2name:
+            return key
+        return None
+
+    def _discard_dead_trigger(self, name, ref):
+        if self._triggers.get(name) is ref:
+            del self._triggers[name]
+        self._triggers_fn2name.pop(ref, None)
+
     def __getitem__(self, name):
         return self.__getattr__(name)
 
@@ -154,6 +413,7 @@ class Controller:
         name = self._translator.translate_key(name)
         if name not in self._func_dict:
             self._func_dict[name] = ControllerFunction(self, name)
+            self._index_func(name)
 
         return self._func_dict[name]
 
@@ -172,14 +432,63 @@ class Controller:
             self._func_dict[name].func = func
         else:
             self._func_dict[name] = ControllerFunction(self, name, func)
+            self._index_func(name)
+
+    def _index_func(self, name):
+        prefix = self._translator.prefix
+        if prefix and name.startswith(prefix):
+            self._namespace_funcs.add(prefix, name)
+
+    def namespace_triggers(self, prefix=None):
+        """
+        List the trigger names registered within a namespace.
+
+        :param prefix: Namespace prefix (default: the one of this controller)
+        :type prefix: str
+        """
+        return self._namespace_triggers.get(prefix or self._translator.prefix)
+
+    def namespace_functions(self, prefix=None):
+        """
+        List the namespaced controller function names.
+
+        :param prefix: Namespace prefix (default: the one of this controller)
+        :type prefix: str
+        """
+        return self._namespace_funcs.get(prefix or self._translator.prefix)
 
-    def add(self, name, clear=False):
+    def clear_namespace(self):
+        """
+        Unregister the triggers and controller functions of this controller
+        namespace. This is a no-op for a controller without prefix.
+        """
+        prefix = self._translator.prefix
+        if not prefix:
+            return
+
+        for name in self._namespace_triggers.unregister(prefix):
+            entry = self._triggers.pop(name, None)
+            if entry is not None:
+                self._triggers_fn2name.pop(entry, None)
+
+        for name in self._namespace_funcs.unregister(prefix):
+            func = self._func_dict.pop(name, None)
+            if func is not None:
+                func.clear()
+
+    def add(self, name, clear=False, weak=False, debounce=None, throttle_hz=None):
         """
         Use as decorator `@ctrl.add(name)` so the decorated function
         will be added to a given controller name
 
         :param name: Controller method name to be added to
         :type name: str
+        :param weak: Only keep a weak reference to the function
+        :type weak: bool
+        :param debounce: Delay in seconds to coalesce calls over
+        :type debounce: float
+        :param throttle_hz: Maximum number of calls per second
+        :type throttle_hz: float
 
         .. code-block::
 
@@ -213,18 +522,20 @@ class Controller:
             if clear:
                 self[name].clear()
 
-            self[name].add(func)
+            self[name].add(func, weak=weak, debounce=debounce, throttle_hz=throttle_hz)
             return func
 
         return register_ctrl_method
 
-    def once(self, name):
+    def once(self, name, weak=False):
         """
         Use as decorator `@ctrl.once(name)` so the decorated function
         will be added to a given controller name and will only execute once.
 
         :param name: Controller method name to be added to
         :type name: str
+        :param weak: Only keep a weak reference to the function
+        :type weak: bool
 
         .. code-block::
 
@@ -240,18 +551,24 @@ class Controller:
         """
 
         def register_ctrl_method(func):
-            self[name].once(func)
+            self[name].once(func, weak=weak)
             return func
 
         return register_ctrl_method
 
-    def add_task(self, name, clear=False):
+    def add_task(self, name, clear=False, weak=False, debounce=None, throttle_hz=None):
         """
         Use as decorator `@ctrl.add_task(name)` so the decorated function
         will be added to a given controller name
 
         :param name: Controller method name to be added to
         :type name: str
+        :param weak: Only keep a weak reference to the function
+        :type weak: bool
+        :param debounce: Delay in seconds to coalesce calls over
+        :type debounce: float
+        :param throttle_hz: Maximum number of calls per second
+        :type throttle_hz: float
 
         .. code-block::
 
@@ -285,7 +602,9 @@ class Controller:
             if clear:
                 self[name].clear()
 
-            self[name].add_task(func)
+            self[name].add_task(
+                func, weak=weak, debounce=debounce, throttle_hz=throttle_hz
+            )
             return func
 
         return register_ctrl_method
@@ -351,82 +670,262 @@ class ControllerFunction:
         # The name is needed to provide more helpful information upon
         # a FunctionNotImplementedError exception.
         self.name = name
-        self.func = func
-        self.funcs = set()
-        self.task_funcs = set()
-        self.funcs_once = set()
+        self._func = func
+        # Ordered sets so functions are executed in their registration order
+        self.funcs = OrderedSet()
+        self.task_funcs = OrderedSet()
+        self.funcs_once = OrderedSet()
         self.can_be_empty = False
+        self._plan = None
+        self._policy = None
+
+    @property
+    def func(self):
+        """Main function to execute first"""
+        return self._func
+
+    @func.setter
+    def func(self, func):
+        self._func = func
+        self._plan = None
+
+    def _compile_plan(self):
+        """
+        Capture what needs to be executed so consecutive calls don't need to
+        gather the registered functions again. The plan get invalidated on
+        any registration change.
+        """
+        self._plan = _ExecutionPlan(
+            self._func, tuple(self.funcs), tuple(self.task_funcs), self.hot_reload
+        )
+        return self._plan
 
     def __call__(self, *args, **kwargs):
-        if (
-            self.func is None
-            and len(self.funcs) + len(self.funcs_once) + len(self.task_funcs) == 0
-        ):
+        if self._policy is None:
+            return self._call(*args, **kwargs)
+        return self._policy(*args, **kwargs)
+
+    def _call(self, *args, **kwargs):
+        plan = self._plan or self._compile_plan()
+
+        # Fast path for a single function
+        if plan.single and not self.funcs_once and not tracing.TRACER.enabled:
+            return _safe_call(plan.func, *args, **kwargs)
+
+        with tracing.span("trame.controller", controller=self.name):
+            return self._execute(plan, args, kwargs)
+
+    def _execute(self, plan, args, kwargs):
+        funcs = plan.funcs
+        if self.funcs_once:
+            funcs = (*funcs, *self.funcs_once)
+            self.funcs_once.clear()
+
+        if plan.func is None and not funcs and not plan.task_funcs:
             if self.can_be_empty:
                 return None
             raise FunctionNotImplementedError(self.name)
 
-        copy_list = list(self.funcs) + list(self.funcs_once)
-        self.funcs_once.clear()
-
         # Exec main function first
         result = None
-        if self.func is not None:
-            if self.hot_reload:
-                f = reload(self.func)
-            else:
-                f = self.func
-
+        if plan.func is not None:
+            f = reload(plan.func) if plan.hot_reload else plan.func
             result = _safe_call(f, *args, **kwargs)
 
-        if self.hot_reload:
-            copy_list = list(map(reload, copy_list))
+        if plan.hot_reload:
+            funcs = tuple(map(reload, funcs))
 
         # Exec added fn after
-        results = [_safe_call(f, *args, **kwargs) for f in copy_list]
+        results = [_safe_call(f, *args, **kwargs) for f in funcs]
 
         # Schedule any task
-        for task_fn in list(self.task_funcs):
-            results.append(
-                asynchronous.create_task(_safe_call(task_fn, *args, **kwargs))
-            )
+        for task_fn in plan.task_funcs:
+            coroutine = _safe_call(task_fn, *args, **kwargs)
+            if coroutine is not None:
+                results.append(asynchronous.create_task(coroutine))
 
         # Figure out return
-        if self.func is None:
+        if plan.func is None:
             return results
-        if copy_list:
+        if funcs:
             return [result, *results]
-        if len(self.task_funcs):
+        if plan.task_funcs:
             return results
         return result
 
-    def once(self, func):
+    async def call_async(self, *args, timeout=None, limit=None, **kwargs):
+        """
+        Execute all the registered functions and wait for their completion.
+
+        Synchronous functions are called first in their registration order,
+        then any awaitable they returned along with the coroutines registered
+        via add_task are awaited concurrently. Errors do not propagate but are
+        captured in the returned results.
+
+        .. code-block::
+
+            results = await ctrl.on_data.call_async(data, timeout=5)
+            values = [r.value for r in results if r.ok]
+
+        :param timeout: Maximum time in seconds to wait for the async members.
+                        Any member still running is cancelled and reported
+                        with an asyncio.TimeoutError.
+        :param limit: Maximum number of async members awaited at once
+
+        :return: One result per executed function
+        :rtype: list[CallResult]
+        """
+        with tracing.span("trame.controller", controller=self.name, mode="async"):
+            results, awaitables = self._call_members(args, kwargs)
+            return await _await_members(results, awaitables, timeout, limit)
+
+    def start_call(self, *args, timeout=None, limit=None, **kwargs):
+        """
+        Same as call_async but the synchronous functions are executed right
+        away instead of when the returned coroutine first runs.
+
+        :return: Coroutine resolving to one result per executed function
+        """
+        with tracing.span("trame.controller", controller=self.name, mode="async"):
+            results, awaitables = self._call_members(args, kwargs)
+        return _await_members(results, awaitables, timeout, limit)
+
+    def _call_members(self, args, kwargs):
+        """Call every member and collect the awaitables they returned"""
+        plan = self._plan or self._compile_plan()
+        funcs = plan.funcs
+        if self.funcs_once:
+            funcs = (*funcs, *self.funcs_once)
+            self.funcs_once.clear()
+
+        if plan.func is None and not funcs and not plan.task_funcs:
+            if self.can_be_empty:
+                return [], []
+            raise FunctionNotImplementedError(self.name)
+
+        members = funcs if plan.func is None else (plan.func, *funcs)
+        if plan.hot_reload:
+            members = tuple(map(reload, members))
+
+        results = []
+        awaitables = []
+        for func in members:
+            result = CallResult(func)
+            results.append(result)
+            try:
+                value = _safe_call(func, *args, **kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                result.error = e
+                continue
+            if inspect.isawaitable(value):
+                awaitables.append((result, value))
+            else:
+                result.value = value
+
+        for task_fn in plan.task_funcs:
+            result = CallResult(task_fn, task=True)
+            results.append(result)
+            try:
+                coroutine = _safe_call(task_fn, *args, **kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                result.error = e
+                continue
+            if coroutine is not None:
+                awaitables.append((result, coroutine))
+
+        return results, awaitables
+
+    def once(self, func, weak=False):
         """
         Add function to the set of functions to be called when
         the current ControllerFunction is called.
         After first execution, the function will automatically be removed.
 
         :param func: Function to add
+        :param weak: Only keep a weak reference to the function
         """
-        self.funcs_once.add(func)
+        self.funcs_once.add(self._entry(func, weak))
 
-    def add(self, func):
+    def add(self, func, weak=False, debounce=None, throttle_hz=None):
         """
         Add function to the set of functions to be called when
         the current ControllerFunction is called.
 
+        .. code-block::
+
+            ctrl.on_resize.add(update_layout, debounce=0.1)
+            ctrl.on_camera_move.add(update_annotations, throttle_hz=30)
+
         :param func: Function to add
+        :param weak: Only keep a weak reference to the function so its
+                     owner can be garbage collected. The entry automatically
+                     get removed once the function is gone.
+        :param debounce: Only execute the function once no call happened
+                         for that many seconds (last arguments win)
+        :param throttle_hz: Execute the function at most that many times
+                            per second (last arguments win)
         """
-        self.funcs.add(func)
+        self.funcs.add(self._entry(func, weak, debounce, throttle_hz))
+        self._plan = None
 
-    def add_task(self, func):
+    def add_task(self, func, weak=False, debounce=None, throttle_hz=None):
         """
         Add task to the set of coroutine to be called when
         the current ControllerFunction is called.
 
         :param func: Function to add
+        :param weak: Only keep a weak reference to the function
+        :param debounce: Delay in seconds to coalesce calls over
+        :param throttle_hz: Maximum number of calls per second
+        """
+        self.task_funcs.add(self._entry(func, weak, debounce, throttle_hz))
+        self._plan = None
+
+    def _entry(self, func, weak, debounce=None, throttle_hz=None):
+        if weak:
+            func = _weak_ref(func, self._discard_dead_ref)
+        if debounce is not None or throttle_hz is not None:
+            func = _ScheduledCall(func, debounce, throttle_hz)
+        return func
+
+    def set_policy(self, debounce=None, throttle_hz=None):
+        """
+        Coalesce the calls to the whole ControllerFunction on the asyncio loop.
+        Calling it without any argument removes the policy.
+
+        .. code-block::
+
+            ctrl.render.set_policy(throttle_hz=30)
+
+        :param debounce: Only execute once no call happened for that many
+                         seconds (last arguments win)
+        :param throttle_hz: Execute at most that many times per second
+                            (last arguments win)
+
+        While a policy is set, calling the ControllerFunction schedules the
+        execution and returns None instead of the result.
+
+        :return: self so it can be used inline like a builder.
         """
-        self.task_funcs.add(func)
+        if self._policy is not None:
+            self._policy.cancel()
+            self._policy = None
+
+        if debounce is not None or throttle_hz is not None:
+            self._policy = _ScheduledCall(self._call, debounce, throttle_hz)
+
+        return self
+
+    @property
+    def policy(self):
+        """Scheduling policy set via set_policy or None"""
+        return self._policy
+
+    def _discard_dead_ref(self, ref):
+        self.funcs.discard(ref)
+        self.funcs_once.discard(ref)
+        self.task_funcs.discard(ref)
+        self._plan = None
 
     def discard(self, func):
         """
@@ -438,9 +937,14 @@ class ControllerFunction:
         if self.func == func:
             self.func = None
 
-        self.funcs.discard(func)
-        self.funcs_once.discard(func)
-        self.task_funcs.discard(func)
+        key = _weak_key(func)
+        for funcs in (self.funcs, self.funcs_once, self.task_funcs):
+            _cancel_scheduled(funcs, func)
+            funcs.discard(func)
+            if key is not None:
+                _cancel_scheduled(funcs, key)
+                funcs.discard(key)
+        self._plan = None
 
     def remove(self, func):
         """
@@ -449,7 +953,10 @@ class ControllerFunction:
 
         :param func: Function to remove
         """
-        self.funcs.remove(func)
+        key = _registered_key(self.funcs, func)
+        _cancel_scheduled(self.funcs, key)
+        self.funcs.remove(key)
+        self._plan = None
 
     def remove_task(self, func):
         """
@@ -458,7 +965,10 @@ class ControllerFunction:
 
         :param func: Function to remove
         """
-        self.task_funcs.remove(func)
+        key = _registered_key(self.task_funcs, func)
+        _cancel_scheduled(self.task_funcs, key)
+        self.task_funcs.remove(key)
+        self._plan = None
 
     def clear(self, set_only=False):
         """
@@ -469,9 +979,14 @@ class ControllerFunction:
         if not set_only:
             self.func = None
 
-        self.funcs.clear()
-        self.funcs_once.clear()
-        self.task_funcs.clear()
+        for funcs in (self.funcs, self.funcs_once, self.task_funcs):
+            for member in funcs:
+                if isinstance(member, _ScheduledCall):
+                    member.cancel()
+            funcs.clear()
+        self._plan = None
+        if self._policy is not None:
+            self._policy.cancel()
 
     def exists(self):
         """
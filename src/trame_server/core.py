@@ -31,6 +31,14 @@ def set_default_client_type(value: ClientType) -> None:
     DEFAULT_CLIENT_TYPE = value
 
 
+def _log_call_errors(results):
+    """Log the failures of a controller call_async and return the successes"""
+    for result in results:
+        if not result.ok:
+            logger.error("Error while executing %r", result.func, exc_info=result.error)
+    return [result for result in results if result.ok]
+
+
 class Server:
     """
     Server implementation for trame.
@@ -43,6 +51,9 @@ class Server:
       - ws_max_msg_size: 10000000 (bytes)
       - ws_heart_beat: 30
       - desktop_debug: False
+      - loop_lag_threshold: None (seconds, enable event loop lag monitor)
+      - trace: None ("memory" or path to a JSON lines file for tracing spans)
+      - workers: None (number of processes of server.workers, default to CPU count)
 
     :param name: A name identifier for a given server
     :type name: str, optional (default: trame)
@@ -79,6 +90,8 @@ class Server:
         self._cli_parser = None
         self._root_protocol = None
         self._protocols_to_configure = []
+        self._hot_reload_watcher = None
+        self._workers = None
 
         # ENV variable mapping settings
         self.hot_reload = "--hot-reload" in sys.argv or bool(
@@ -97,6 +110,15 @@ class Server:
             self._options["desktop_debug"] = self._options.get(
                 "desktop_debug", os.environ.get("TRAME_DESKTOP_DEBUG")
             )
+            self._options["loop_lag_threshold"] = self._options.get(
+                "loop_lag_threshold", os.environ.get("TRAME_LOOP_LAG_THRESHOLD")
+            )
+            self._options["trace"] = self._options.get(
+                "trace", os.environ.get("TRAME_TRACE")
+            )
+            self._options["workers"] = self._options.get(
+                "workers", os.environ.get("TRAME_WORKERS")
+            )
             # reset default wslink startup message
             os.environ["WSLINK_READY_MSG"] = ""
 
@@ -146,6 +168,24 @@ class Server:
         translator = translator or Translator(prefix=prefix)
         return Server(translator=translator, parent_server=self)
 
+    def destroy(self) -> None:
+        """
+        Release everything registered through a child server: its state and
+        context keys, change listeners, triggers, controller functions and
+        the matching entries of the client state cache.
+        """
+        if self._parent_server is None:
+            msg = "Only a child server can be destroyed"
+            raise RuntimeError(msg)
+
+        keys = self._state.destroy()
+        self._context.destroy()
+        self._controller.clear_namespace()
+
+        protocol = self.protocol
+        if protocol:
+            protocol.clear_state_client_cache(*keys)
+
     # -------------------------------------------------------------------------
     # State management helpers
     # -------------------------------------------------------------------------
@@ -412,6 +452,13 @@ class Server:
             action="store_true",
         )
 
+        self._cli_parser.add_argument(
+            "--trame-workers",
+            dest="trame_workers",
+            help="Number of processes used by server.workers (default: CPU count)",
+            type=int,
+        )
+
         CoreServer.add_arguments(self._cli_parser)
 
         return self._cli_parser
@@ -464,6 +511,82 @@ class Server:
         have been issued before locking the server"""
         return asyncio.ensure_future(self.context.network_monitor.completion())
 
+    @property
+    def loop_monitor(self):
+        """Return the event loop lag monitor if enabled, None otherwise"""
+        if self.root_server != self:
+            return self.root_server.loop_monitor
+
+        return self.context.loop_monitor
+
+    @property
+    def workers(self):
+        """
+        Process pool to run jobs connected to the server state
+        (see trame_server.utils.workers.WorkerPool).
+        It gets created on first access and shut down when the server exits.
+        """
+        if self.root_server != self:
+            return self.root_server.workers
+
+        if self._workers is None:
+            from .utils.workers import WorkerPool  # noqa: PLC0415
+
+            size = (
+                self.cli.parse_known_args()[0].trame_workers or self.options["workers"]
+            )
+            self._workers = WorkerPool(self, int(size) if size else None)
+            self.controller.on_server_exited.add(self._shutdown_workers)
+
+        return self._workers
+
+    def _shutdown_workers(self, **_) -> None:
+        if self._workers is not None:
+            self._workers.shutdown()
+            self._workers = None
+
+    def _start_loop_monitor(self) -> None:
+        threshold = self.options.get("loop_lag_threshold")
+        if not threshold:
+            return
+
+        if self.context.loop_monitor is None:
+            from .utils.loop_monitor import LoopLagMonitor  # noqa: PLC0415
+
+            self.context.loop_monitor = LoopLagMonitor(threshold=float(threshold))
+
+        # Also restart the monitor kept from a previous run
+        self.context.loop_monitor.start()
+
+    def _stop_loop_monitor(self) -> None:
+        if self.context.loop_monitor is not None:
+            self.context.loop_monitor.stop()
+
+    def _start_hot_reload_watcher(self) -> None:
+        if not self.hot_reload or self._hot_reload_watcher is not None:
+            return
+
+        from .utils.hot_reload import HotReloadWatcher  # noqa: PLC0415
+
+        loop = asyncio.get_running_loop()
+
+        def on_files_changed(updated, _errors):
+            if updated:
+                loop.call_soon_threadsafe(self._on_source_files_changed, updated)
+
+        self._hot_reload_watcher = HotReloadWatcher(callback=on_files_changed)
+        self._hot_reload_watcher.start()
+
+    def _stop_hot_reload_watcher(self) -> None:
+        if self._hot_reload_watcher is not None:
+            self._hot_reload_watcher.stop()
+            self._hot_reload_watcher = None
+
+    def _on_source_files_changed(self, paths) -> None:
+        logger.info("Hot reload: %s", ", ".join(paths))
+        if self.controller.on_server_reload.exists():
+            self.controller.on_server_reload()
+
     @property
     def ready(self):
         """Return a future that will resolve once the server is ready"""
@@ -495,6 +618,25 @@ class Server:
             "state": self.state.initial,
         }
 
+    def memory_report(self, top=10):
+        """
+        Estimate the memory retained by the shared state and the server context.
+        Sizes are tracked incrementally so this can be sampled periodically.
+
+        :param top: Number of biggest keys to report for each container
+        :type top: int
+
+        :return: dict with a "state" and "context" report
+                 (see trame_server.state.State.memory_usage)
+        """
+        protocol = self.protocol
+        return {
+            "state": self.state.memory_usage(
+                top, serialized_cache=protocol._clients_state if protocol else None
+            ),
+            "context": self.context.memory_usage(top),
+        }
+
     def clear_state_client_cache(self, *state_names):
         protocol = self.protocol
         if protocol:
@@ -553,7 +695,7 @@ class Server:
         :param *args: Set of key names to be send again to the client.
         """
         self.protocol_call(
-            "trame.force.push", *[self._translator.translate_key(k) for k in key_names]
+            "trame.force.push", *self._translator.translate_list(key_names)
         )
 
     # -------------------------------------------------------------------------
@@ -735,15 +877,16 @@ class Server:
         # Manage exit life cycle unless coroutine
         if exec_mode == "main":
             self._running_stage = 0
+            self._stop_loop_monitor()
+            self._stop_hot_reload_watcher()
             if self.controller.on_server_exited.exists():
                 loop = asyncio.get_event_loop()
-                for exit_task in self.controller.on_server_exited(
-                    **self.state.to_dict()
-                ):
-                    if inspect.isawaitable(exit_task):
-                        loop.run_until_complete(exit_task)
-                    elif callable(exit_task):
-                        result = exit_task()
+                results = loop.run_until_complete(
+                    self.controller.on_server_exited.call_async(**self.state.to_dict())
+                )
+                for exit_result in _log_call_errors(results):
+                    if callable(exit_result.value):
+                        result = exit_result.value()
                         if inspect.isawaitable(result):
                             loop.run_until_complete(result)
         elif hasattr(task, "add_done_callback"):
@@ -752,8 +895,15 @@ class Server:
                 try:
                     task.result()
                     self._running_stage = 0
+                    self._stop_loop_monitor()
+                    self._stop_hot_reload_watcher()
                     if self.controller.on_server_exited.exists():
-                        self.controller.on_server_exited(**self.state.to_dict())
+                        # Synchronous hooks run right away, before the loop
+                        # gets a chance to shut down
+                        pending = self.controller.on_server_exited.start_call(
+                            **self.state.to_dict()
+                        )
+                        utils.asynchronous.create_task(self._exit_lifecycle(pending))
                 except asyncio.CancelledError:
                     self._resolve_ready_future(result=False)
                 except Exception as e:  # pylint: disable=broad-except
@@ -764,11 +914,16 @@ class Server:
 
         return task
 
+    async def _exit_lifecycle(self, pending) -> None:
+        _log_call_errors(await pending)
+
     async def stop(self) -> None:
         """Coroutine for stopping the server"""
         if self.root_server != self:
             await self.root_server.stop()
         elif self._running_stage:
+            self._stop_loop_monitor()
+            self._stop_hot_reload_watcher()
             await self._server.stop()
             self._running_future = None
         self._running_stage = 0
@@ -8,7 +8,7 @@ from wslink import server
 from wslink.websocket import ServerProtocol
 
 from trame_server.state import TRAME_NON_INIT_VALUE
-from trame_server.utils import clean_state, logger
+from trame_server.utils import clean_state, logger, tracing
 
 
 class CoreServer(ServerProtocol):
@@ -22,6 +22,7 @@ class CoreServer(ServerProtocol):
     @staticmethod
     def bind_server(server):
         logger.initialize_logger(server.options)
+        tracing.initialize_tracer(server.options)
         CoreServer.server = server
 
         # Forward options to wslink
@@ -105,6 +106,12 @@ class CoreServer(ServerProtocol):
             self.server.state.ready()
             self.server.context.ready()
 
+            # Monitor event loop responsiveness if requested
+            self.server._start_loop_monitor()
+
+            # Recompile modified sources in the background
+            self.server._start_hot_reload_watcher()
+
             # Add on_server_exception
             self.server.protocol.log_emitter.add_event_listener(
                 "exception", self.server.controller.on_exception.enable_empty()
@@ -145,26 +152,29 @@ class CoreServer(ServerProtocol):
     # ---------------------------------------------------------------
 
     def push_state_change(self, modified_state, skip_last_active_client=False):
-        ok, str_values = clean_state(modified_state)
-        # Only send changes
-        state_to_send = {}
-        for key, value in ok.items():
-            prev_str = self._clients_state.get(key, TRAME_NON_INIT_VALUE)
-            new_str = str_values.get(key, TRAME_NON_INIT_VALUE)
-            if prev_str != new_str:
-                state_to_send[key] = value
-
-        # Log and send state
-        if state_to_send:
-            logger.state_s2c(state_to_send)
-            self.publish(
-                "trame.state.topic",
-                state_to_send,
-                skip_last_active_client=skip_last_active_client,
-            )
-
-        # Keep track of last push
-        self._clients_state.update(str_values)
+        with tracing.span("trame.state.push", keys=len(modified_state)) as span:
+            ok, str_values = clean_state(modified_state)
+            # Only send changes
+            state_to_send = {}
+            for key, value in ok.items():
+                prev_str = self._clients_state.get(key, TRAME_NON_INIT_VALUE)
+                new_str = str_values.get(key, TRAME_NON_INIT_VALUE)
+                if prev_str != new_str:
+                    state_to_send[key] = value
+
+            # Log and send state
+            if state_to_send:
+                span.set_attribute("sent", len(state_to_send))
+                logger.state_s2c(state_to_send)
+                with tracing.span("trame.publish", topic="trame.state.topic"):
+                    self.publish(
+                        "trame.state.topic",
+                        state_to_send,
+                        skip_last_active_client=skip_last_active_client,
+                    )
+
+            # Keep track of last push
+            self._clients_state.update(str_values)
 
     # ---------------------------------------------------------------
 
@@ -178,7 +188,7 @@ class CoreServer(ServerProtocol):
 
     def clear_state_client_cache(self, *keys):
         for k in keys:
-            del self._clients_state[k]
+            self._clients_state.pop(k, None)
 
     # ---------------------------------------------------------------
     # RPCs
@@ -226,7 +236,7 @@ class CoreServer(ServerProtocol):
     @exportRpc("trame.trigger")
     async def trigger(self, name, args, kwargs):
         logger.action_c2s({"name": name, "args": args, "kwargs": kwargs})
-        with self.server.state:
+        with tracing.span("trame.trigger", trigger=name), self.server.state:
             fn = self.server.controller.trigger_fn(name)
             if fn:
                 result = fn(*args, **kwargs)
@@ -243,7 +253,7 @@ class CoreServer(ServerProtocol):
     def update_state(self, changes):
         logger.state_c2s(changes)
 
-        with self.server.state:
+        with tracing.span("trame.state.update", keys=len(changes)), self.server.state:
             client_state = {}
             for change in changes:
                 client_state[change["key"]] = change.get("value")
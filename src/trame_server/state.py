@@ -3,11 +3,12 @@ import logging
 import weakref
 from collections import deque
 from contextlib import contextmanager
-from typing import Any, Iterable, Iterator
 
-from .utils import asynchronous, is_dunder, is_private, share
+from .utils import asynchronous, is_dunder, is_private, share, tracing
 from .utils.hot_reload import reload
-from .utils.namespace import Translator
+from .utils.memory import SizeTracker
+from .utils.namespace import NamespaceIndex, Translator
+from .utils.ordered_set import OrderedSet
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,10 @@ class StateStatus:
     def __init__(self, flushing: bool = False, ready: bool = False):
         self.flushing = flushing
         self.ready = ready
+        # Incremented each time a new key get added to the state
+        self.keys_version = 0
+        # Incremented each time keys get flagged as dirty
+        self.dirty_version = 0
 
     def mark_ready(self):
         self.ready = True
@@ -44,44 +49,10 @@ class StateStatus:
             self.flushing = False
 
 
-class _OrderedSet:
-    """
-    Lightweight ordered set implementation based on dict to preserve insertion order
-    without external dependencies.
-    """
-
-    def __init__(self, *args: Any) -> None:
-        self._data: dict[Any, None] = {}
-        for arg in args:
-            self.add(arg)
-
-    def __bool__(self) -> bool:
-        return bool(self._data)
-
-    def __contains__(self, key: Any) -> bool:
-        return key in self._data
-
-    def __iter__(self) -> Iterator[Any]:
-        return iter(self._data)
-
-    def add(self, key: Any) -> None:
-        self._data[key] = None
-
-    def clear(self) -> None:
-        self._data.clear()
-
-    def discard(self, key: Any) -> None:
-        self._data.pop(key, None)
-
-    def update(self, iterable: Iterable[Any]) -> None:
-        for item in iterable:
-            self.add(item)
-
-
 class StateChangeHandler:
     def __init__(self, listeners):
         self._all_listeners = listeners
-        self._currents = _OrderedSet()
+        self._currents = OrderedSet()
 
     def add(self, key):
         if key in self._all_listeners:
@@ -105,9 +76,9 @@ class _SuppressListenersChangeStack:
     """
 
     def __init__(self):
-        self._deque: deque[_OrderedSet] = deque()
-        self._suppressed_keys: _OrderedSet | None = None
-        self._listener_keys: _OrderedSet = _OrderedSet()
+        self._deque: deque[OrderedSet] = deque()
+        self._suppressed_keys: OrderedSet | None = None
+        self._listener_keys: OrderedSet = OrderedSet()
 
     def on_pending_key_added(self, key: str) -> None:
         if not self._is_suppressed(key):
@@ -117,7 +88,7 @@ class _SuppressListenersChangeStack:
         self._listener_keys.discard(key)
 
     def push(self, *keys: str) -> None:
-        self._deque.append(_OrderedSet(*keys))
+        self._deque.append(OrderedSet(*keys))
         self._update_suppressed_keys()
 
     def pop(self) -> None:
@@ -128,9 +99,9 @@ class _SuppressListenersChangeStack:
         self._update_suppressed_keys()
 
     def clear(self) -> None:
-        self._listener_keys = _OrderedSet()
+        self._listener_keys = OrderedSet()
 
-    def get_change_listener_keys(self) -> _OrderedSet:
+    def get_change_listener_keys(self) -> OrderedSet:
         return self._listener_keys
 
     def _is_suppressed(self, key: str) -> bool:
@@ -151,7 +122,7 @@ class _SuppressListenersChangeStack:
             self._suppressed_keys = None
             return
 
-        self._suppressed_keys = _OrderedSet()
+        self._suppressed_keys = OrderedSet()
         for d_set in self._deque:
             if not d_set:
                 self._suppressed_keys.clear()
@@ -194,6 +165,12 @@ class State:
             internal, "_state_listeners", StateChangeHandler(self._change_callbacks)
         )
         self._status = share(internal, "_status", StateStatus(ready=ready))
+        self._size_tracker = share(internal, "_size_tracker", SizeTracker())
+        self._namespace_keys = share(internal, "_namespace_keys", NamespaceIndex())
+        self._namespace_listeners = share(
+            internal, "_namespace_listeners", NamespaceIndex()
+        )
+        self._namespace_keys.register(self._translator.prefix)
         self._parent_state = internal
         self._children_state = []
         if internal:
@@ -209,6 +186,25 @@ class State:
         """Return the translator instance used to namespace the variable names."""
         return self._translator
 
+    @property
+    def keys_version(self) -> int:
+        """Counter incremented each time a new key get added to the state."""
+        return self._status.keys_version
+
+    @property
+    def dirty_version(self) -> int:
+        """
+        Counter incremented each time keys get flagged with dirty().
+        As dirty() keeps the value reference, it allows caches keyed on
+        value identity to detect in place modifications.
+        """
+        return self._status.dirty_version
+
+    def _track_new_key(self, key) -> None:
+        if key not in self._pending_update and key not in self._pushed_state:
+            self._status.keys_version += 1
+            self._namespace_keys.add_key(key, self._translator.prefix)
+
     def ready(self) -> None:
         """Mark the state as ready for synchronization."""
         if self.is_ready:
@@ -228,6 +224,8 @@ class State:
                 self._pending_update.pop(key, None)
                 self._suppress_change_stack.on_pending_key_removed(key)
                 return
+        else:
+            self._track_new_key(key)
 
         self._pending_update[key] = value
         self._suppress_change_stack.on_pending_key_added(key)
@@ -275,6 +273,7 @@ class State:
                 change_detected += 1
 
         if change_detected:
+            self._track_new_key("trame__client_only")
             self._pending_update["trame__client_only"] = full_list
             self.flush()
 
@@ -289,9 +288,7 @@ class State:
     def has(self, key):
         """Check is a key is currently available in the state"""
         _key = self._translator.translate_key(key)
-        result = _key in self._pushed_state or _key in self._pending_update
-        logger.info("has(%s => %s) = %s", key, _key, result)
-        return result
+        return _key in self._pushed_state or _key in self._pending_update
 
     def setdefault(self, key, value):
         """
@@ -302,9 +299,29 @@ class State:
         if key in self._pushed_state:
             return self._pushed_state[key]
 
+        self._track_new_key(key)
         self._suppress_change_stack.on_pending_key_added(key)
         return self._pending_update.setdefault(key, value)
 
+    def remove(self, *_args):
+        """
+        Remove keys from the server state without calling any listener.
+        Connected clients are not notified and keep their last value.
+
+        :param *_args: List of names to remove
+        :type *_args: str
+        """
+        for key in self._translator.translate_list(_args):
+            if key not in self._pending_update and key not in self._pushed_state:
+                continue
+
+            self._pending_update.pop(key, None)
+            self._pushed_state.pop(key, None)
+            self._suppress_change_stack.on_pending_key_removed(key)
+            self._namespace_keys.discard(self._namespace_keys.match(key), key)
+            self._size_tracker.mark_modified([key])
+            self._status.keys_version += 1
+
     def is_dirty(self, *_args):
         """
         Check if any provided key name(s) still has a pending
@@ -338,7 +355,9 @@ class State:
         to its previous value.
         """
         _args = self._translator.translate_list(_args)
+        self._status.dirty_version += 1
         for key in _args:
+            self._track_new_key(key)
             self._pending_update.setdefault(key, self._pushed_state.get(key))
             self._suppress_change_stack.on_pending_key_added(key)
 
@@ -354,10 +373,13 @@ class State:
             if key in self._pending_update:
                 self._pushed_state[key] = self._pending_update.pop(key)
                 self._suppress_change_stack.on_pending_key_removed(key)
+                self._size_tracker.mark_modified((key,))
 
     def update(self, _dict):
         """Update the current state dict with the provided one"""
         _dict = self._translator.translate_dict(_dict)
+        for key in _dict:
+            self._track_new_key(key)
         self._pending_update.update(_dict)
         for key in _dict:
             if _dict[key] == self._pushed_state.get(key, TRAME_NON_INIT_VALUE):
@@ -399,8 +421,12 @@ class State:
         # for child server we may need to run the translator on them
         return self._modified_keys
 
-    def _flush_pending_keys(self) -> set[str]:
-        _keys = set(self._pending_update.keys())
+    def _flush_pending_keys(self, keys=None) -> set[str]:
+        if keys is None:
+            changes = self._pending_update
+        else:
+            changes = {key: self._pending_update.pop(key) for key in keys}
+        _keys = set(changes.keys())
 
         # update modified keys for current update batch
         self._modified_keys.clear()
@@ -408,17 +434,22 @@ class State:
 
         # Do the flush
         if self._push_state_fn:
-            self._push_state_fn(self._pending_update)
-        self._pushed_state.update(self._pending_update)
-        self._pending_update.clear()
+            self._push_state_fn(changes)
+        self._pushed_state.update(changes)
+        if keys is None:
+            self._pending_update.clear()
+        self._size_tracker.mark_modified(_keys)
 
         # Execute state listeners
-        self._state_listeners.add_all(
-            self._suppress_change_stack.get_change_listener_keys()
-        )
-
         # Clear change keys before triggering listeners as listeners can trigger modifications in chain
-        self._suppress_change_stack.clear()
+        listener_keys = self._suppress_change_stack.get_change_listener_keys()
+        if keys is None:
+            self._state_listeners.add_all(listener_keys)
+            self._suppress_change_stack.clear()
+        else:
+            self._state_listeners.add_all([k for k in listener_keys if k in _keys])
+            for key in _keys:
+                self._suppress_change_stack.on_pending_key_removed(key)
 
         for fn, translator in self._state_listeners:
             if isinstance(fn, weakref.WeakMethod):
@@ -437,7 +468,11 @@ class State:
             )
 
             try:
-                coroutine = callback(**reverse_translated_state)
+                with tracing.span(
+                    "trame.state.change",
+                    callback=getattr(callback, "__qualname__", repr(callback)),
+                ):
+                    coroutine = callback(**reverse_translated_state)
                 if inspect.isawaitable(coroutine):
                     asynchronous.create_task(coroutine)
             except Exception as e:
@@ -446,30 +481,196 @@ class State:
         self._state_listeners.clear()
         return _keys
 
-    def flush(self):
+    def flush(self, scope=None):
         """
         Force pushing modified state and execute any @state.change listener
         if the variable value is different (by value AND reference) from its
         previous value or if `dirty` has been flagged on the variable and it has
         not been unflagged since.
+
+        :param scope: By default the whole shared state get flushed.
+                      With "namespace", a child state only pushes its own keys
+                      (the ones using its translator prefix) and only the
+                      listeners of those keys get executed. Other children
+                      pending changes are left untouched.
+        :type scope: str
         """
+        if scope not in (None, "namespace"):
+            msg = f"Invalid flush scope: {scope}"
+            raise ValueError(msg)
+
         if self._status.skip_flushing:
             return None
 
+        prefix = self.namespace if scope == "namespace" else None
         keys = set()
-        with self._status.flushing_context():
-            while bool(self._pending_update):
-                keys |= self._flush_pending_keys()
+        with tracing.span("trame.state.flush"), self._status.flushing_context():
+            while True:
+                batch = self._pending_update
+                if prefix:
+                    match = self._namespace_keys.match
+                    batch = [k for k in self._pending_update if match(k) == prefix]
+                if not batch:
+                    break
+
+                with tracing.span("trame.state.flush.cycle", keys=len(batch)):
+                    keys |= self._flush_pending_keys(batch if prefix else None)
 
         return keys
 
+    def snapshot(self, scope="namespace"):
+        """
+        Return the current values (pending changes included) without
+        flushing anything.
+
+        :param scope: With "namespace" (default) only the keys of this state
+                      namespace are returned using their local names.
+                      Otherwise (or for a state without prefix) the full
+                      state is returned.
+        :type scope: str
+
+        :rtype: dict
+        """
+        prefix = self.namespace if scope == "namespace" else None
+        if not prefix:
+            return {**self._pushed_state, **self._pending_update}
+
+        result = {}
+        reverse_translate_key = self._translator.reverse_translate_key
+        for key in self._namespace_keys.get(prefix):
+            if key in self._pending_update:
+                result[reverse_translate_key(key)] = self._pending_update[key]
+            elif key in self._pushed_state:
+                result[reverse_translate_key(key)] = self._pushed_state[key]
+
+        return result
+
     @property
     def initial(self):
         """Return the initial state without triggering a flush"""
+        self._size_tracker.mark_modified(self._pending_update.keys())
         self._pushed_state.update(self._pending_update)
         self._pending_update.clear()
         return self._pushed_state
 
+    def memory_usage(self, top=10, serialized_cache=None):
+        """
+        Estimate the memory retained by the state values.
+        Only the values committed since the previous call get measured again.
+        Values mutated in place without calling `dirty()` keep their previous size.
+
+        :param top: Number of biggest keys to report
+        :type top: int
+
+        :param serialized_cache: Optional dict of msgpack encoded values
+                                 to reuse for the serialized size
+        :type serialized_cache: dict
+
+        :return: dict with count, object and serialized totals (bytes) of
+                 the flushed values, the same totals for the pending values
+                 (measured on each call) and the top entries across both
+                 (key, namespace, object, serialized, pending).
+        """
+        self._size_tracker.refresh(self._pushed_state, serialized_cache)
+        return self._size_tracker.report(
+            top, self._namespace_prefixes(), self._pending_update
+        )
+
+    # -------------------------------------------------------------------------
+    # Namespace
+    # -------------------------------------------------------------------------
+
+    @property
+    def namespace(self):
+        """Prefix of the keys managed by this state (None for the root state)"""
+        return self._translator.prefix
+
+    def namespace_keys(self, prefix=None):
+        """
+        List the keys belonging to a namespace without scanning the state.
+
+        :param prefix: Namespace prefix (default: the one of this state)
+        :type prefix: str
+
+        :return: The translated keys in their creation order
+        :rtype: list[str]
+        """
+        return self._namespace_keys.get(prefix or self.namespace)
+
+    def namespace_listeners(self, prefix=None):
+        """
+        List the change listeners registered within a namespace.
+
+        :param prefix: Namespace prefix (default: the one of this state)
+        :type prefix: str
+
+        :return: list of (translated key, callback)
+        """
+        return [
+            (name, func)
+            for name, (func, _) in self._namespace_listeners.get(
+                prefix or self.namespace
+            )
+        ]
+
+    def clear_namespace(self):
+        """
+        Remove all the keys and change listeners of this state namespace.
+        This is a no-op for a state without prefix.
+
+        :return: The removed translated keys
+        :rtype: list[str]
+        """
+        prefix = self.namespace
+        if not prefix:
+            return []
+
+        keys = self._namespace_keys.unregister(prefix)
+        for key in keys:
+            self._pending_update.pop(key, None)
+            self._pushed_state.pop(key, None)
+            self._suppress_change_stack.on_pending_key_removed(key)
+        self._size_tracker.mark_modified(keys)
+
+        for name, entry in self._namespace_listeners.unregister(prefix):
+            callbacks = self._change_callbacks.get(name, [])
+            if entry in callbacks:
+                callbacks.remove(entry)
+            if not callbacks:
+                self._change_callbacks.pop(name, None)
+
+        # Cached translations may rely on the removed keys
+        self._status.keys_version += 1
+        return keys
+
+    def destroy(self):
+        """
+        Clear the namespace of this state and detach it from its parent.
+
+        :return: The removed translated keys
+        :rtype: list[str]
+        """
+        keys = self.clear_namespace()
+        if self._parent_state is not None:
+            if self in self._parent_state._children_state:
+                self._parent_state._children_state.remove(self)
+            self._parent_state = None
+        return keys
+
+    def _namespace_prefixes(self):
+        root = self
+        while root._parent_state is not None:
+            root = root._parent_state
+
+        prefixes = set()
+        states = [root]
+        while states:
+            state = states.pop()
+            prefixes.add(state.translator.prefix)
+            states.extend(state._children_state)
+
+        return prefixes
+
     def __enter__(self):
         return self
 
@@ -506,11 +707,34 @@ class State:
                 if name not in self._change_callbacks:
                     self._change_callbacks[name] = []
 
-                self._change_callbacks[name].append((func, self._translator))
+                entry = (func, self._translator)
+                self._change_callbacks[name].append(entry)
+                self._namespace_listeners.add(self._translator.prefix, (name, entry))
             return func
 
         return register_change_callback
 
+    def remove_change(self, func, *_args):
+        """
+        Unregister a function previously registered with `change`.
+
+        :param func: The registered function
+        :param *_args: Variable names to stop monitoring (default: all)
+        :type *_args: str
+        """
+        names = self._translator.translate_list(_args) if _args else None
+        for name in names or list(self._change_callbacks):
+            callbacks = self._change_callbacks.get(name)
+            if not callbacks:
+                continue
+
+            for entry in [e for e in callbacks if e[0] == func]:
+                callbacks.remove(entry)
+                self._namespace_listeners.discard(entry[1].prefix, (name, entry))
+
+            if not callbacks:
+                self._change_callbacks.pop(name, None)
+
     @contextmanager
     def suppress_change_listeners(self, *keys: str):
         """
@@ -521,9 +745,7 @@ class State:
         When used in a child state, the input key should be the untranslated state key.
         """
 
-        self._suppress_change_stack.push(
-            *[self.translator.translate_key(k) for k in keys]
-        )
+        self._suppress_change_stack.push(*self.translator.translate_list(keys))
         try:
             yield
         finally:
@@ -1,10 +1,25 @@
 import asyncio
 import logging
+import multiprocessing
+import queue as queue_module
+import sys
+import threading
+import time
+from array import array
+from multiprocessing import resource_tracker, shared_memory
 
 from . import is_dunder, is_private
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 __all__ = [
+    "SharedBuffer",
+    "StateBridge",
     "StateQueue",
+    "WorkerState",
     "create_state_queue_monitor_task",
     "create_task",
     "decorate_task",
@@ -13,6 +28,9 @@ __all__ = [
 ]
 
 QUEUE_EXIT = "STOP"
+QUEUE_CANCEL = "CANCEL"
+
+_MANAGER = None
 
 
 def handle_task_result(task: asyncio.Task) -> None:
@@ -57,28 +75,126 @@ def decorate_task(task):
     return task
 
 
-async def _queue_update_state(server, queue, delay=1):
-    _monitor_queue = True
-    while _monitor_queue:
-        if queue.empty():
-            await asyncio.sleep(delay)
+def _read_queue(queue, loop, deliver, stop_event, timeout):
+    """
+    Blocking reader running in its own thread. Each wakeup drains what is
+    available and forwards it as a single batch to the loop.
+    The timeout only bounds how long a stop request can take to be noticed.
+    Once stopped, the messages left in the queue are not touched so another
+    reader can still consume them.
+    """
+    while not stop_event.is_set():
+        try:
+            batch = [queue.get(timeout=timeout)]
+        except queue_module.Empty:
+            continue
+        except (EOFError, OSError, ValueError):
+            # Queue (or its manager) closed
+            batch = [QUEUE_EXIT]
+
+        while batch[-1] != QUEUE_EXIT:
+            try:
+                batch.append(queue.get_nowait())
+            except queue_module.Empty:
+                break
+
+        try:
+            loop.call_soon_threadsafe(deliver, batch)
+        except RuntimeError:
+            # Loop closed
+            _release_messages(batch)
+            return
+
+        if batch[-1] == QUEUE_EXIT:
+            return
+
+
+def _release_messages(messages):
+    """Release the shared memory of messages which won't be applied"""
+    for msg in messages:
+        SharedBuffer.release_all(msg)
+
+
+def _apply_queue_messages(server, messages, coalesce=True):
+    """
+    Apply the state updates of a batch of queue messages.
+
+    Updates get merged per key so a batch is applied with a single flush.
+    With coalesce disabled, a new flush is started when a key shows up
+    again so no intermediate value gets dropped.
+
+    :return: False once the exit message has been reached
+    """
+    updates = [{}]
+    keep_running = True
+    for msg in messages:
+        if isinstance(msg, str):
+            if msg == QUEUE_EXIT:
+                keep_running = False
+                break
+            continue
+
+        values = SharedBuffer.load_all(msg)
+        if not coalesce and not updates[-1].keys().isdisjoint(values):
+            updates.append({})
+        updates[-1].update(values)
+
+    for update in updates:
+        if update:
+            with server.state:
+                server.state.update(update)
+
+    return keep_running
+
+
+async def _queue_update_state(server, queue, delay=1, coalesce=True):
+    loop = asyncio.get_running_loop()
+    inbox = asyncio.Queue()
+    stop_event = threading.Event()
+
+    def deliver(batch):
+        # Batches posted by the reader after the task stopped are not applied
+        if stop_event.is_set():
+            _release_messages(batch)
         else:
-            msg = queue.get_nowait()
-            if isinstance(msg, str):
-                if msg == QUEUE_EXIT:
-                    _monitor_queue = False
-            else:
-                with server.state:
-                    server.state.update(msg)
+            inbox.put_nowait(batch)
 
+    threading.Thread(
+        target=_read_queue,
+        args=(queue, loop, deliver, stop_event, delay),
+        name="trame-state-queue",
+        daemon=True,
+    ).start()
 
-def create_state_queue_monitor_task(server, queue, delay=1):
+    try:
+        _monitor_queue = True
+        while _monitor_queue:
+            messages = await inbox.get()
+            while not inbox.empty():
+                messages.extend(inbox.get_nowait())
+            _monitor_queue = _apply_queue_messages(server, messages, coalesce)
+    finally:
+        stop_event.set()
+        while not inbox.empty():
+            _release_messages(inbox.get_nowait())
+
+
+def create_state_queue_monitor_task(server, queue, delay=1, coalesce=True):
     """
     Create and schedule a task to watch over the provided queue
     to update a server state.
     This is especially useful when using a multiprocess executor
     and you want to report progress into your current server.
 
+    The queue is read from a background thread so messages get applied as
+    soon as they arrive. All the messages available at once are merged per
+    key and applied with a single flush.
+    Values sent through shared memory (see StateQueue) are copied into the
+    state and their segment released.
+    Once the task is done, messages already read from the queue but not
+    applied get their shared memory released while the ones still in the
+    queue are left for another monitor to consume.
+
     :param server: A coroutine to execute as an independent task
     :type server: trame_server.core.Server
 
@@ -86,14 +202,126 @@ def create_state_queue_monitor_task(server, queue, delay=1):
                   the parallel process to the given server
     :type queue: multiprocessing.Queue
 
-    :param delay: Time to sleep in seconds before processing
-                  the queue once emptied
+    :param delay: Maximum time in seconds for the reader thread to
+                  notice the task got cancelled
     :type delay: float
 
+    :param coalesce: Only keep the latest value of each key within a batch
+                     and apply the whole batch with a single flush (default).
+                     When False, a key showing up again starts a new flush
+                     so change listeners see every intermediate value.
+    :type coalesce: bool
+
     :return: The monitoring task
     :rtype: asyncio.Task
     """
-    return create_task(_queue_update_state(server, queue, delay=delay))
+    return create_task(
+        _queue_update_state(server, queue, delay=delay, coalesce=coalesce)
+    )
+
+
+class SharedBuffer:
+    """
+    Picklable handle to a buffer value (bytes like, array.array or numpy
+    array) copied into a shared memory segment.
+
+    The process creating the handle gives up the ownership of the segment
+    which is released by the process loading it.
+    """
+
+    __slots__ = ("dtype", "kind", "name", "shape", "size")
+
+    def __init__(self, name, size, kind, dtype=None, shape=None):
+        self.name = name
+        self.size = size
+        self.kind = kind
+        self.dtype = dtype
+        self.shape = shape
+
+    @staticmethod
+    def nbytes(value):
+        """Size in bytes of a supported buffer value or None"""
+        if isinstance(value, (bytes, bytearray, memoryview, array)):
+            return memoryview(value).nbytes
+        if np is not None and isinstance(value, np.ndarray):
+            return value.nbytes
+        return None
+
+    @classmethod
+    def create(cls, value):
+        """Copy a buffer value into a new shared memory segment"""
+        dtype = shape = None
+        if isinstance(value, array):
+            kind, dtype = "array", value.typecode
+        elif np is not None and isinstance(value, np.ndarray):
+            kind, dtype, shape = "ndarray", value.dtype.str, value.shape
+            value = np.ascontiguousarray(value)
+        else:
+            kind = "bytes"
+
+        data = memoryview(value).cast("B")
+        segment = _create_segment(data.nbytes)
+        try:
+            segment.buf[: data.nbytes] = data
+        finally:
+            segment.close()
+
+        return cls(segment.name, data.nbytes, kind, dtype, shape)
+
+    def load(self):
+        """Copy the value out of the shared memory and release the segment"""
+        segment = shared_memory.SharedMemory(name=self.name)
+        try:
+            data = bytes(segment.buf[: self.size])
+        finally:
+            segment.close()
+            segment.unlink()
+
+        if self.kind == "array":
+            value = array(self.dtype)
+            value.frombytes(data)
+            return value
+        if self.kind == "ndarray":
+            return np.frombuffer(data, dtype=self.dtype).reshape(self.shape).copy()
+        return data
+
+    def release(self):
+        """Release the segment without reading it"""
+        try:
+            segment = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        segment.close()
+        segment.unlink()
+
+    @classmethod
+    def load_all(cls, values):
+        """Return the given dict with any handle replaced by its value"""
+        if not any(isinstance(v, cls) for v in values.values()):
+            return values
+        return {k: v.load() if isinstance(v, cls) else v for k, v in values.items()}
+
+    @classmethod
+    def release_all(cls, values):
+        """Release the handles of a message which won't be loaded"""
+        if isinstance(values, dict):
+            for value in values.values():
+                if isinstance(value, cls):
+                    value.release()
+
+    def __repr__(self):
+        return f"SharedBuffer({self.name}, {self.size} bytes)"
+
+
+def _create_segment(size):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+
+    # Prevent the resource tracker of the creating process to remove the
+    # segment when that process ends before the consumer loads it
+    segment = shared_memory.SharedMemory(create=True, size=size)
+    resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
 
 
 class StateQueue:
@@ -108,14 +336,34 @@ class StateQueue:
     :param auto_flush: Should you manage the state update phase or just
                        propagate as soon as you update a property
     :type auto_flush: Boolean
+
+    :param shared_memory_threshold: When provided, buffer values (bytes like,
+                                    array.array or numpy array) of at least
+                                    that many bytes are sent through shared
+                                    memory and only a small handle goes
+                                    through the queue
+    :type shared_memory_threshold: int
+
+    :param max_rate: When provided along with auto_flush, maximum number of
+                     messages sent per second. Changes made in between get
+                     coalesced (latest value per key) and sent by a
+                     background timer.
+    :type max_rate: float
     """
 
-    def __init__(self, queue, auto_flush=True):
+    def __init__(
+        self, queue, auto_flush=True, shared_memory_threshold=None, max_rate=None
+    ):
         self._queue = queue
         self._pending_update = {}
         self._pushed_state = {}
         self._auto_flush = auto_flush
+        self._shared_memory_threshold = shared_memory_threshold
         self._ctx_count = 0
+        self._min_interval = 1 / max_rate if max_rate else 0
+        self._last_flush = 0
+        self._flush_timer = None
+        self._flush_lock = threading.RLock()
 
     @property
     def queue(self):
@@ -126,9 +374,10 @@ class StateQueue:
         return self._pending_update.get(key, self._pushed_state.get(key))
 
     def __setitem__(self, key, value):
-        self._pending_update[key] = value
-        if self._auto_flush:
-            self.flush()
+        with self._flush_lock:
+            self._pending_update[key] = value
+            if self._auto_flush:
+                self._schedule_flush()
 
     def __getattr__(self, key):
         if is_dunder(key):
@@ -153,20 +402,60 @@ class StateQueue:
         :param _dict: A dict containing one or many key/value pair
         :type _dict: dict
         """
-        self._pending_update.update(_dict)
-        if self._auto_flush:
-            self.flush()
+        with self._flush_lock:
+            self._pending_update.update(_dict)
+            if self._auto_flush:
+                self._schedule_flush()
 
     def flush(self):
         """Explicitly push any local change to the queue."""
-        if len(self._pending_update):
-            self._queue.put_nowait(self._pending_update)
-            self._pushed_state.update(self._pending_update)
-            self._pending_update = {}
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if len(self._pending_update):
+                self._queue.put_nowait(self._share_buffers(self._pending_update))
+                self._pushed_state.update(self._pending_update)
+                self._pending_update = {}
+                self._last_flush = time.monotonic()
+
+    def _schedule_flush(self):
+        """Flush right away unless that would exceed max_rate"""
+        if self._flush_timer is not None:
+            # Already scheduled, the new values will be part of it
+            return
+
+        delay = self._last_flush + self._min_interval - time.monotonic()
+        if delay <= 0:
+            self.flush()
+            return
+
+        self._flush_timer = threading.Timer(delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _share_buffers(self, values):
+        threshold = self._shared_memory_threshold
+        if threshold is None:
+            return values
+
+        message = {}
+        for key, value in values.items():
+            size = SharedBuffer.nbytes(value)
+            if size and size >= threshold:
+                message[key] = SharedBuffer.create(value)
+            else:
+                message[key] = value
+        return message
 
     def exit(self):
         """Release the monitoring task as we are done with our work"""
-        self._queue.put_nowait(QUEUE_EXIT)
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                # Don't lose the changes held back by max_rate
+                self.flush()
+            self._queue.put_nowait(QUEUE_EXIT)
 
     def __enter__(self):
         self._ctx_count += 1
@@ -180,6 +469,272 @@ class StateQueue:
             self.exit()
 
 
+def _shared_manager():
+    """Multiprocessing manager started on first use to create shareable queues"""
+    global _MANAGER  # noqa: PLW0603
+    if _MANAGER is None:
+        _MANAGER = multiprocessing.Manager()
+    return _MANAGER
+
+
+class _BridgeEndpoint:
+    """Picklable description of a bridge handed to the worker"""
+
+    __slots__ = ("keys", "status_key", "to_server", "to_worker")
+
+    def __init__(self, to_server, to_worker, keys, status_key=None):
+        self.to_server = to_server
+        self.to_worker = to_worker
+        self.keys = keys
+        self.status_key = status_key
+
+
+class StateBridge:
+    """
+    Server side of a two way state exchange with a worker process.
+
+    Updates coming from the worker are applied like with
+    create_state_queue_monitor_task, while changes of the declared keys on
+    the server are sent to the worker (one message per flush).
+    The worker side is a WorkerState created from the bridge endpoint.
+
+    >>> bridge = StateBridge(server, ["resolution"])
+    >>> executor.submit(solve, bridge.endpoint)
+    >>> bridge.cancel()
+
+    :param server: Server owning the state to synchronize
+    :type server: trame_server.core.Server
+
+    :param keys: State names the worker can read and listen to
+    :type keys: list[str]
+
+    :param to_server: Queue for worker to server messages
+    :param to_worker: Queue for server to worker messages
+                      (both default to queues from a shared
+                      multiprocessing manager so they can be passed to
+                      process pool executors)
+
+    :param coalesce: Forwarded to create_state_queue_monitor_task
+    :type coalesce: bool
+
+    :param status_key: State name updated by WorkerState.set_progress
+    :type status_key: str
+    """
+
+    def __init__(
+        self,
+        server,
+        keys=(),
+        to_server=None,
+        to_worker=None,
+        coalesce=True,
+        status_key=None,
+    ):
+        if to_server is None:
+            to_server = _shared_manager().Queue()
+        if to_worker is None:
+            to_worker = _shared_manager().Queue()
+
+        self._server = server
+        self._keys = list(keys)
+        self._names = server.state.translator.translate_list(self._keys)
+        self._to_worker = to_worker
+        self._closed = False
+        self._cancel_requested = False
+        self._done_callbacks = []
+        self.endpoint = _BridgeEndpoint(to_server, to_worker, self._keys, status_key)
+
+        if self._keys:
+            server.state.change(*self._keys)(self._on_change)
+            self._to_worker.put_nowait({k: server.state[k] for k in self._keys})
+
+        self._monitor = create_state_queue_monitor_task(
+            server, to_server, coalesce=coalesce
+        )
+        self._monitor.add_done_callback(self._on_monitor_done)
+
+    @property
+    def done(self):
+        """True once the worker exited or the bridge got closed"""
+        return self._closed
+
+    @property
+    def cancel_requested(self):
+        """True once cancel() got called"""
+        return self._cancel_requested
+
+    def cancel(self):
+        """Ask the worker to stop (see WorkerState.cancelled)"""
+        if not self._closed:
+            self._cancel_requested = True
+            self._to_worker.put_nowait(QUEUE_CANCEL)
+
+    def add_done_callback(self, callback):
+        """Register a function called with the bridge once closed"""
+        if self._closed:
+            callback(self)
+        else:
+            self._done_callbacks.append(callback)
+
+    def close(self):
+        """Stop exchanging state with the worker"""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._server.state.remove_change(self._on_change, *self._keys)
+        self._monitor.cancel()
+        try:
+            self._to_worker.put_nowait(QUEUE_EXIT)
+        except (EOFError, OSError, ValueError):
+            pass
+
+        callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def _on_change(self, **_):
+        modified = self._server.state.modified_keys
+        update = {
+            key: self._server.state[key]
+            for key, name in zip(self._keys, self._names)
+            if name in modified
+        }
+        if update:
+            self._to_worker.put_nowait(update)
+
+    def _on_monitor_done(self, _task):
+        self.close()
+
+
+class WorkerState(StateQueue):
+    """
+    Worker side of a StateBridge.
+
+    Behaves like a StateQueue to push updates to the server, while the
+    values of the keys declared on the bridge are kept up to date from a
+    background thread. Change callbacks registered with `change` are called
+    from the worker thread when calling `poll`.
+
+    :param endpoint: The StateBridge endpoint
+    :param auto_flush: See StateQueue
+    :param shared_memory_threshold: See StateQueue
+    :param max_rate: See StateQueue
+    """
+
+    def __init__(
+        self, endpoint, auto_flush=True, shared_memory_threshold=None, max_rate=None
+    ):
+        super().__init__(
+            endpoint.to_server, auto_flush, shared_memory_threshold, max_rate
+        )
+        self._incoming = endpoint.to_worker
+        self._status_key = endpoint.status_key
+        self._received = {}
+        self._change_callbacks = {}
+        self._lock = threading.Lock()
+        self._updated_event = threading.Event()
+        self._cancel_event = threading.Event()
+        self._stop_event = threading.Event()
+        threading.Thread(
+            target=self._receive,
+            name="trame-worker-state",
+            daemon=True,
+        ).start()
+
+    @property
+    def cancelled(self):
+        """True once the server side requested the work to stop"""
+        return self._cancel_event.is_set()
+
+    def set_progress(self, progress, message=None):
+        """
+        Report the progress of the work when the bridge has a status key
+        (always the case for jobs submitted to server.workers).
+
+        :param progress: Progress value (usually in the [0, 1] range)
+        :param message: Optional text describing the current step
+        """
+        if self._status_key:
+            self[self._status_key] = {
+                "status": "running",
+                "progress": progress,
+                "message": message,
+            }
+
+    def change(self, *_args):
+        """
+        Decorator registering a function called by `poll` with the current
+        values as keyword arguments when any of the listed keys changed.
+        """
+
+        def register_change_callback(func):
+            for name in _args:
+                self._change_callbacks.setdefault(name, []).append(func)
+            return func
+
+        return register_change_callback
+
+    def poll(self, timeout=None):
+        """
+        Run the change callbacks of the keys updated by the server since the
+        previous call.
+
+        :param timeout: Time in seconds to wait for an update
+                        (default: don't wait)
+        :type timeout: float
+
+        :return: The updated key names
+        :rtype: list[str]
+        """
+        if timeout:
+            self._updated_event.wait(timeout)
+
+        with self._lock:
+            self._updated_event.clear()
+            received, self._received = self._received, {}
+
+        callbacks = []
+        for name in received:
+            for callback in self._change_callbacks.get(name, []):
+                if callback not in callbacks:
+                    callbacks.append(callback)
+
+        values = {**self._pushed_state, **self._pending_update}
+        for callback in callbacks:
+            callback(**values)
+
+        return list(received)
+
+    def exit(self):
+        self._stop_event.set()
+        super().exit()
+
+    def _receive(self):
+        while not self._stop_event.is_set():
+            try:
+                msg = self._incoming.get(timeout=0.1)
+            except queue_module.Empty:
+                continue
+            except (EOFError, OSError, ValueError):
+                return
+
+            if isinstance(msg, str):
+                if msg == QUEUE_CANCEL:
+                    self._cancel_event.set()
+                    self._updated_event.set()
+                elif msg == QUEUE_EXIT:
+                    return
+                continue
+
+            with self._flush_lock, self._lock:
+                for key in msg:
+                    self._pending_update.pop(key, None)
+                self._pushed_state.update(msg)
+                self._received.update(msg)
+                self._updated_event.set()
+
+
 def task(func):
     """Function decorator to make its async execution within a task"""
 
@@ -8,6 +8,11 @@ limited support for nested functions as well*.
 This module also provides a `reload` function that can be used to reload
 a function on demand, i. e. `new_func = reload(old_func)`.
 
+Compiled functions are cached and the source file is only parsed again
+once its modification time or size change. A `HotReloadWatcher` can also
+poll those files from a background thread so the compilation happens off
+the event loop and errors get logged instead of waiting on stdin.
+
 This module is based upon Julian Vossen's reloading library:
 https://github.com/julvo/reloading
 
@@ -32,14 +37,19 @@ the capture variable instead.
 """
 
 import ast
+import copy
 import functools
 import inspect
+import logging
 import site
 import sys
+import threading
 import traceback
 import types
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 try:
     from trame_client.ui.core import AbstractLayout
     from trame_client.widgets.core import AbstractElement
@@ -63,6 +73,164 @@ SKIP_LAMBDA_FUNCS = True
 # in editable environments.
 SKIP_SITE_PACKAGES = True
 
+# Compiled functions keyed by (path, qualname). Entries are only rebuilt
+# when the file mtime or size differ from the ones used to compile it.
+_COMPILE_CACHE = {}
+
+
+class _CompiledFunction:
+    __slots__ = ("code", "func", "globals", "source_globals", "version")
+
+    def __init__(self, version, code):
+        self.version = version
+        self.code = code
+        self.func = None
+        self.globals = None
+        self.source_globals = None
+
+
+# Running watchers. While any is active, reload never blocks on stdin.
+_ACTIVE_WATCHERS = set()
+
+
+def clear_cache():
+    """Forget all the compiled functions so they get parsed again"""
+    _COMPILE_CACHE.clear()
+
+
+class HotReloadWatcher:
+    """
+    Watch the source files of the reloaded functions from a background
+    thread using stat polling.
+
+    Changed files are recompiled within that thread and the new code get
+    swapped into the compile cache so the next reload() picks it up without
+    touching the file system. Compilation errors are logged and the previous
+    code is kept until the file is fixed.
+
+    :param interval: Time in seconds between each file check
+    :type interval: float
+    :param callback: Function called from the watcher thread with the list of
+                     updated paths and the list of (path, error) that failed
+    """
+
+    def __init__(self, interval=1.0, callback=None):
+        self.interval = interval
+        self.callback = callback
+        # Version of the files (by path) or functions (by key) which failed
+        self._failed = {}
+        self._stop_event = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        """Start polling in a daemon thread"""
+        if self._thread is not None:
+            return
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop_event,),
+            name="trame-hot-reload",
+            daemon=True,
+        )
+        _ACTIVE_WATCHERS.add(self)
+        self._thread.start()
+
+    def stop(self):
+        """Stop polling"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        _ACTIVE_WATCHERS.discard(self)
+
+    def check(self):
+        """
+        Recompile the functions whose file changed since their last compilation.
+
+        :return: The list of updated paths and the list of (path, error)
+        """
+        entries_by_path = {}
+        for key, entry in list(_COMPILE_CACHE.items()):
+            entries_by_path.setdefault(key[0], []).append((key, entry))
+
+        updated = []
+        errors = []
+        for path, entries in entries_by_path.items():
+            try:
+                stat = Path(path).stat()
+            except OSError:
+                continue
+
+            version = (stat.st_mtime_ns, stat.st_size)
+            if self._failed.get(path) == version:
+                continue
+            outdated = [
+                key
+                for key, entry in entries
+                if entry.version != version and self._failed.get(key) != version
+            ]
+            if not outdated:
+                continue
+
+            try:
+                source = Path(path).read_text()
+                if not source:
+                    # File is being saved
+                    continue
+                file_tree = ast.parse(source + "\n", filename=path)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Hot reload failed for %s", path, exc_info=e)
+                self._failed[path] = version
+                errors.append((path, e))
+                continue
+
+            # Each function is handled on its own so one failure does not
+            # leave the other functions of the file stale
+            self._failed.pop(path, None)
+            compiled = False
+            for key in outdated:
+                qualname = key[1]
+                try:
+                    tree = _extract_function_def(qualname.split(".")[-1], file_tree)
+                    if tree is None:
+                        # Compiled again (and reported) on its next reload
+                        _COMPILE_CACHE.pop(key, None)
+                        msg = f"Failed to find '{qualname}' in file '{path}'"
+                        raise Exception(msg)
+                    code = compile(tree, filename="", mode="exec")
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.error("Hot reload failed for %s", qualname, exc_info=e)
+                    self._failed[key] = version
+                    errors.append((path, e))
+                    continue
+
+                self._failed.pop(key, None)
+                _COMPILE_CACHE[key] = _CompiledFunction(version, code)
+                compiled = True
+
+            if compiled:
+                updated.append(path)
+
+        return updated, errors
+
+    def _run(self, stop_event):
+        while not stop_event.wait(self.interval):
+            try:
+                updated, errors = self.check()
+                if (updated or errors) and self.callback is not None:
+                    self.callback(updated, errors)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Hot reload watcher error")
+
 
 def hot_reload(func):
     """Decorator to reload the function on every call
@@ -118,12 +286,34 @@ def reload(func, perform_checks=True):
         try:
             return _reload_func(func)
         except Exception:
+            if _ACTIVE_WATCHERS:
+                # Keep the event loop going, the watcher will pick up the fix
+                logger.exception("Failed to reload '%s'", func.__qualname__)
+                return func
             _handle_exception(func)
 
 
 def _reload_func(func):
+    entry = _compiled_function(func)
+    code = entry.code
+
+    if "<locals>" not in func.__qualname__:
+        # Global function: reuse the function built from the same code
+        # and only refresh its globals with the current module ones.
+        if entry.source_globals is not func.__globals__:
+            entry.source_globals = func.__globals__
+            entry.globals = func.__globals__.copy()
+            exec(code, entry.globals)
+            entry.func = entry.globals[func.__name__]
+        else:
+            entry.globals.update(func.__globals__)
+            entry.globals[func.__name__] = entry.func
+
+        if isinstance(func, types.MethodType):
+            return types.MethodType(entry.func, func.__self__)
+        return entry.func
+
     func_locals = _find_function_locals(func)
-    code = _recompile_function(func)
 
     # Unfortunately, exec is a little challenging here for non-global
     # functions.
@@ -152,6 +342,24 @@ def _reload_func(func):
     return new_func
 
 
+def _compiled_function(func):
+    path = inspect.getfile(func)
+    key = (path, func.__qualname__)
+    if _ACTIVE_WATCHERS and key in _COMPILE_CACHE:
+        # The watcher keeps the cache up to date
+        return _COMPILE_CACHE[key]
+
+    stat = Path(path).stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _COMPILE_CACHE.get(key)
+    if entry is None or entry.version != version:
+        entry = _CompiledFunction(version, _recompile_function(func))
+        _COMPILE_CACHE[key] = entry
+
+    return entry
+
+
 def _find_function_locals(func):
     # First, look at the qualified name.
     # If <locals> is not in the qualified name, then the locals should be
@@ -183,6 +391,8 @@ def _parse_func_file_until_successful(func):
         try:
             return ast.parse(source)
         except SyntaxError:
+            if _ACTIVE_WATCHERS:
+                raise
             _handle_exception(func)
 
 
@@ -213,6 +423,18 @@ def _isolate_function_def(funcname, tree):
     return False
 
 
+def _extract_function_def(funcname, tree):
+    """Same as _isolate_function_def but on a copy of the function definition
+    so the tree can be reused for other functions"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == funcname:
+            module = ast.Module(body=[copy.deepcopy(node)], type_ignores=[])
+            _isolate_function_def(funcname, module)
+            return module
+
+    return None
+
+
 def _handle_exception(func):
     fpath = inspect.getfile(func)
     exc = traceback.format_exc()
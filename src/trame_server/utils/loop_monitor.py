@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from .asynchronous import create_task
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "LoopLagMonitor",
+]
+
+
+class LoopLagMonitor:
+    """
+    Sample the asyncio event loop responsiveness and report blocking code.
+
+    A sampler task measures how late the loop wakes up compared to the
+    requested sleep interval. In parallel, a watchdog thread checks that the
+    sampler keeps ticking. When the loop is stuck for longer than the
+    threshold, the watchdog captures the stack of the loop thread so the
+    blocking call can be identified while it is still running.
+
+    :param interval: Time in seconds between two samples
+    :type interval: float
+
+    :param threshold: Lag in seconds above which the loop is considered blocked
+    :type threshold: float
+
+    :param window: Number of samples to keep for computing percentiles
+    :type window: int
+
+    :param max_reports: Number of blocking reports to keep
+    :type max_reports: int
+    """
+
+    def __init__(self, interval=0.1, threshold=0.5, window=1000, max_reports=20):
+        self.interval = float(interval)
+        self.threshold = float(threshold)
+        self._samples = deque(maxlen=window)
+        self._reports = deque(maxlen=max_reports)
+        self._listeners = []
+        self._loop = None
+        self._loop_thread_id = None
+        self._task = None
+        self._watchdog = None
+        self._stop_event = threading.Event()
+        self._last_tick = 0
+        self._tick_reported = False
+
+    # -------------------------------------------------------------------------
+    # Life cycle
+    # -------------------------------------------------------------------------
+
+    @property
+    def running(self):
+        """Return True if the monitor is currently sampling the loop"""
+        return self._task is not None and not self._task.done()
+
+    def start(self, loop=None):
+        """
+        Start sampling the given loop (default: running loop).
+        Must be called from the thread running the loop.
+        """
+        if self.running:
+            return
+
+        self._loop = loop or asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event = threading.Event()
+        self._last_tick = time.monotonic()
+        self._tick_reported = False
+        self._task = create_task(self._sample(), loop=self._loop)
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            args=(self._stop_event,),
+            name="trame-loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+
+    def stop(self):
+        """Stop sampling and release the watchdog thread"""
+        self._stop_event.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._watchdog = None
+
+    # -------------------------------------------------------------------------
+    # Listeners
+    # -------------------------------------------------------------------------
+
+    def add_listener(self, callback):
+        """
+        Register a function called from the watchdog thread with each
+        blocking report (dict with lag, timestamp and stack).
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregister a function previously added with add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    @property
+    def samples(self):
+        """Copy of the lag samples (in seconds) currently held"""
+        return list(self._samples)
+
+    @property
+    def reports(self):
+        """Copy of the latest blocking reports"""
+        return list(self._reports)
+
+    def percentiles(self, *quantiles):
+        """
+        Compute lag percentiles in seconds over the current window.
+
+        :param *quantiles: Percentiles to compute (default: 50, 90, 99)
+        :return: dict mapping each percentile to its lag value
+        """
+        if not quantiles:
+            quantiles = (50, 90, 99)
+
+        values = sorted(self._samples)
+        if not values:
+            return dict.fromkeys(quantiles, 0.0)
+
+        last = len(values) - 1
+        return {q: values[min(last, round(q / 100 * last))] for q in quantiles}
+
+    def stats(self):
+        """Summary of the loop lag with p50/p90/p99/max and blocking count"""
+        p = self.percentiles(50, 90, 99)
+        return {
+            "count": len(self._samples),
+            "p50": p[50],
+            "p90": p[90],
+            "p99": p[99],
+            "max": max(self._samples, default=0.0),
+            "blocked": len(self._reports),
+        }
+
+    def clear(self):
+        """Reset samples and reports"""
+        self._samples.clear()
+        self._reports.clear()
+
+    # -------------------------------------------------------------------------
+    # Internal
+    # -------------------------------------------------------------------------
+
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self._samples.append(max(0.0, loop.time() - start - self.interval))
+            self._last_tick = time.monotonic()
+            self._tick_reported = False
+
+    def _watch(self, stop_event):
+        deadline = self.interval + self.threshold
+        period = max(0.01, min(self.interval, self.threshold) / 2)
+        while not stop_event.wait(period):
+            lag = time.monotonic() - self._last_tick
+            if lag > deadline and not self._tick_reported:
+                self._tick_reported = True
+                self._report(lag - self.interval)
+
+    def _report(self, lag):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+
+        stack = "".join(traceback.format_stack(frame))
+        report = {"lag": lag, "timestamp": time.time(), "stack": stack}
+        self._reports.append(report)
+        logger.warning("Event loop blocked for more than %.3fs in:\n%s", lag, stack)
+
+        for callback in list(self._listeners):
+            try:
+                callback(report)
+            except Exception:
+                logger.exception("Loop lag listener error")
@@ -0,0 +1,152 @@
+import heapq
+import sys
+
+import msgpack
+
+from . import clean_value
+
+__all__ = [
+    "SizeTracker",
+    "deep_sizeof",
+    "serialized_sizeof",
+]
+
+CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+
+def deep_sizeof(obj):
+    """
+    Estimate the memory retained by a value.
+    Builtin containers are walked recursively (each object counted once)
+    while any other object only report its own size.
+    """
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, CONTAINER_TYPES):
+            stack.extend(item)
+
+    return size
+
+
+def serialized_sizeof(obj):
+    """Size in bytes of the msgpack encoding of a value or None if not serializable"""
+    try:
+        return len(msgpack.packb(clean_value(obj)))
+    except Exception:
+        return None
+
+
+class SizeTracker:
+    """
+    Incremental bookkeeping of the size of state entries.
+
+    Keys get marked as modified when their value is committed and only those
+    get measured again when a report is requested.
+    """
+
+    def __init__(self):
+        self._sizes = {}
+        self._modified = set()
+        self._all_modified = True
+        self._object_total = 0
+        self._serialized_total = 0
+
+    def mark_modified(self, keys):
+        """Flag keys which need to be measured again"""
+        if not self._all_modified:
+            self._modified.update(keys)
+
+    def reset(self):
+        """Forget every measurement"""
+        self._sizes.clear()
+        self._modified.clear()
+        self._all_modified = True
+        self._object_total = 0
+        self._serialized_total = 0
+
+    def refresh(self, values, serialized_cache=None):
+        """
+        Measure modified entries.
+
+        :param values: dict holding the committed values
+        :param serialized_cache: Optional dict of already serialized values
+                                 used instead of encoding again
+        """
+        if self._all_modified:
+            keys = list(values.keys())
+            self.reset()
+            self._all_modified = False
+        else:
+            keys = self._modified
+            self._modified = set()
+
+        for key in keys:
+            prev_object, prev_serialized = self._sizes.pop(key, (0, 0))
+            self._object_total -= prev_object
+            self._serialized_total -= prev_serialized or 0
+            if key not in values:
+                continue
+
+            value = values[key]
+            cached = serialized_cache.get(key) if serialized_cache else None
+            object_size = deep_sizeof(value)
+            serialized_size = (
+                len(cached) if cached is not None else serialized_sizeof(value)
+            )
+            self._sizes[key] = (object_size, serialized_size)
+            self._object_total += object_size
+            self._serialized_total += serialized_size or 0
+
+    def report(self, top=10, namespaces=None, pending=None):
+        """
+        Return totals along with the N biggest entries (python object size).
+
+        :param top: Number of entries to list
+        :param namespaces: List of key prefixes used to tag each entry
+        :param pending: Optional dict of uncommitted values which get
+                        measured on the fly and ranked with the others
+        """
+        pending_sizes = {
+            key: (deep_sizeof(value), serialized_sizeof(value))
+            for key, value in (pending or {}).items()
+        }
+        candidates = [(key, sizes, False) for key, sizes in self._sizes.items()]
+        candidates.extend((key, sizes, True) for key, sizes in pending_sizes.items())
+
+        prefixes = sorted((p for p in namespaces or [] if p), key=len, reverse=True)
+        entries = []
+        for key, (object_size, serialized_size), is_pending in heapq.nlargest(
+            top, candidates, key=lambda item: item[1][0]
+        ):
+            namespace = next((p for p in prefixes if key.startswith(p)), "")
+            entries.append(
+                {
+                    "key": key,
+                    "namespace": namespace,
+                    "object": object_size,
+                    "serialized": serialized_size,
+                    "pending": is_pending,
+                }
+            )
+
+        return {
+            "count": len(self._sizes),
+            "object": self._object_total,
+            "serialized": self._serialized_total,
+            "pending": {
+                "count": len(pending_sizes),
+                "object": sum(size[0] for size in pending_sizes.values()),
+                "serialized": sum(size[1] or 0 for size in pending_sizes.values()),
+            },
+            "top": entries,
+        }
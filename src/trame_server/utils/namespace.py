@@ -1,6 +1,5 @@
 import logging
-
-from more_itertools import split_when
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +40,12 @@ JS_DELIMITOR = {
 }
 
 
-def js_tokenizer(a, b):
-    return a in JS_DELIMITOR or b in JS_DELIMITOR
-
+# Split an expression around each delimiter (captured) so identifiers
+# are at even indices of the resulting list
+JS_SPLIT = re.compile("([" + "".join(re.escape(c) for c in sorted(JS_DELIMITOR)) + "])")
 
-def vue_template_tokenizer(a, b):
-    return a == b and a in {"{", "}"}
+# Split between consecutive "{{" or "}}"
+VUE_TEMPLATE_SPLIT = re.compile(r"(?<=\{)(?=\{)|(?<=\})(?=\})")
 
 
 def is_name_reserved(name):
@@ -59,23 +58,142 @@ def is_name_reserved(name):
     return False
 
 
+class NamespaceIndex:
+    """
+    Index items (state keys, listeners, triggers...) by namespace prefix
+    so what belongs to a child server can be found without scanning
+    everything. Items registered without a prefix are not indexed.
+    """
+
+    def __init__(self):
+        self._items = {}
+        # Number of registered prefixes per length (longest first) so a key
+        # gets matched with one dict lookup per distinct prefix length
+        self._lengths = {}
+
+    @property
+    def prefixes(self):
+        """Registered prefixes (longest first)"""
+        return sorted(self._items, key=len, reverse=True)
+
+    def register(self, prefix):
+        """Declare a prefix so matching keys can be indexed with add_key"""
+        if prefix and prefix not in self._items:
+            self._items[prefix] = {}
+            size = len(prefix)
+            if size in self._lengths:
+                self._lengths[size] += 1
+            else:
+                self._lengths[size] = 1
+                self._lengths = dict(sorted(self._lengths.items(), reverse=True))
+
+    def unregister(self, prefix):
+        """Forget a prefix along with all its items"""
+        if prefix in self._items:
+            size = len(prefix)
+            self._lengths[size] -= 1
+            if not self._lengths[size]:
+                del self._lengths[size]
+        return list(self._items.pop(prefix, {}))
+
+    def match(self, key):
+        """Return the longest registered prefix of key or None"""
+        items = self._items
+        key_size = len(key)
+        for size in self._lengths:
+            if size <= key_size and key[:size] in items:
+                return key[:size]
+        return None
+
+    def add(self, prefix, item):
+        if prefix:
+            self.register(prefix)
+            self._items[prefix][item] = None
+
+    def add_key(self, key, prefix=None):
+        """Index key under prefix if it matches or any matching prefix"""
+        if not prefix or not key.startswith(prefix):
+            prefix = self.match(key)
+        self.add(prefix, key)
+
+    def discard(self, prefix, item):
+        if prefix in self._items:
+            self._items[prefix].pop(item, None)
+
+    def get(self, prefix):
+        """Items registered for prefix in their registration order"""
+        return list(self._items.get(prefix, ()))
+
+    def count(self, prefix):
+        return len(self._items.get(prefix, ()))
+
+
 class Translator:
-    """Helper for mapping or namespacing names for state or controller"""
+    """Helper for mapping or namespacing names for state or controller
 
-    def __init__(self, prefix=None):
+    Translated keys are memoized in both directions within bounded per instance
+    caches which get cleared when the prefix or translations change.
+
+    :param prefix: Prefix to add to any non reserved key
+    :param cache_size: Maximum number of keys memoized in each direction
+    """
+
+    def __init__(self, prefix=None, cache_size=4096):
         logger.info("Translator(prefix=%s)", prefix)
         self._prefix = prefix
         self._transl = {}
         self._reverse_transl = {}
+        self._cache_size = cache_size
+        self._expression_cache = {}
+        self._key_cache = {}
+        self._reverse_key_cache = {}
+
+    @property
+    def prefix(self):
+        """Prefix used to namespace the keys (None if not namespaced)"""
+        return self._prefix
+
+    @property
+    def identity(self):
+        """True when keys are left untouched (no prefix nor translation)"""
+        return not self._prefix and not self._transl
 
     def set_prefix(self, prefix):
         self._prefix = prefix
+        self.clear_cache()
 
     def add_translation(self, key, translated_key):
         self._transl[key] = translated_key
         self._reverse_transl[translated_key] = key
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Forget the memoized translations"""
+        # New containers so a copy does not wipe the caches of its source
+        self._key_cache = {}
+        self._reverse_key_cache = {}
+        self._expression_cache = {}
 
     def translate_key(self, key):
+        return self._cached_key(self._key_cache, key, self._translate_key)
+
+    def reverse_translate_key(self, translated_key):
+        return self._cached_key(
+            self._reverse_key_cache, translated_key, self._reverse_translate_key
+        )
+
+    def _cached_key(self, cache, key, translate):
+        result = cache.get(key)
+        if result is None:
+            result = translate(key)
+            if len(cache) >= self._cache_size:
+                # Drop oldest entry
+                del cache[next(iter(cache))]
+            cache[key] = result
+
+        return result
+
+    def _translate_key(self, key):
         # Reserved keys
         if is_name_reserved(key):
             return key
@@ -88,7 +206,7 @@ class Translator:
 
         return key
 
-    def reverse_translate_key(self, translated_key):
+    def _reverse_translate_key(self, translated_key):
         # Reserved keys
         if is_name_reserved(translated_key):
             return translated_key
@@ -102,15 +220,24 @@ class Translator:
         return translated_key
 
     def translate_list(self, key_list):
-        return [self.translate_key(v) for v in key_list]
+        if self.identity:
+            return list(key_list)
+        return list(map(self.translate_key, key_list))
 
     def translate_dict(self, key_dict):
-        return {self.translate_key(k): v for k, v in key_dict.items()}
+        if self.identity:
+            return dict(key_dict)
+        return dict(zip(map(self.translate_key, key_dict), key_dict.values()))
 
     def reverse_translate_list(self, key_list):
-        return [self.reverse_translate_key(v) for v in key_list]
+        if self.identity:
+            return list(key_list)
+        return list(map(self.reverse_translate_key, key_list))
 
     def reverse_translate_dict(self, key_dict):
+        if self.identity:
+            return dict(key_dict)
+
         d = {}
 
         for key, value in key_dict.items():
@@ -125,30 +252,48 @@ class Translator:
         return d
 
     def translate_js_expression(self, state, expression):
-        tokens = []
-        for token in split_when(expression, js_tokenizer):
-            token_str = "".join(token)
-            logger.info("(prefix=%s) token %s", self._prefix, token_str)
-            if state.has(token_str):
-                _token = self.translate_key(token_str)
-                logger.info("(prefix=%s) translated %s", self._prefix, _token)
-                tokens.append(_token)
-            else:
-                tokens.append(token_str)
+        return self._cached_expression(
+            state, expression, False, self._translate_js_expression
+        )
 
-        logger.info(" => %s", "".join(tokens))
+    def translate_vue_templating(self, state, expression):
+        return self._cached_expression(
+            state, expression, True, self._translate_vue_templating
+        )
+
+    def _cached_expression(self, state, expression, template, translate):
+        # Translation depends on the available keys, so only reuse
+        # a result when we know the state did not gain any new key.
+        keys_version = getattr(state, "keys_version", None)
+        if keys_version is None:
+            return translate(state, expression)
+
+        cache_key = (self._prefix, expression, template, keys_version)
+        result = self._expression_cache.get(cache_key)
+        if result is None:
+            result = translate(state, expression)
+            if len(self._expression_cache) >= self._cache_size:
+                # Drop oldest entry
+                del self._expression_cache[next(iter(self._expression_cache))]
+            self._expression_cache[cache_key] = result
+
+        return result
+
+    def _translate_js_expression(self, state, expression):
+        tokens = JS_SPLIT.split(expression)
+        for i in range(0, len(tokens), 2):
+            token = tokens[i]
+            if token and state.has(token):
+                tokens[i] = self.translate_key(token)
 
         return "".join(tokens)
 
-    def translate_vue_templating(self, state, expression):
-        tokens = []
-        for token in split_when(expression, vue_template_tokenizer):
-            token_str = "".join(token)
-            logger.info(" token %s", token_str)
-            if token_str.startswith("{"):
-                tokens.append(self.translate_js_expression(state, token_str))
-            else:
-                tokens.append(token_str)
+    def _translate_vue_templating(self, state, expression):
+        tokens = VUE_TEMPLATE_SPLIT.split(expression)
+        for i, token in enumerate(tokens):
+            if token.startswith("{"):
+                tokens[i] = self._translate_js_expression(state, token)
+
         return "".join(tokens)
 
     def __call__(self, key):
@@ -0,0 +1,51 @@
+from typing import Any, Iterable, Iterator
+
+__all__ = [
+    "OrderedSet",
+]
+
+
+class OrderedSet:
+    """
+    Lightweight ordered set implementation based on dict to preserve insertion order
+    without external dependencies.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        # Items are also stored as values so the registered instance can be
+        # retrieved from an equal key
+        self._data: dict[Any, Any] = {}
+        for arg in args:
+            self.add(arg)
+
+    def __bool__(self) -> bool:
+        return bool(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def add(self, key: Any) -> None:
+        self._data.setdefault(key, key)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the stored item equal to key"""
+        return self._data.get(key, default)
+
+    def discard(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def remove(self, key: Any) -> None:
+        del self._data[key]
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        for item in iterable:
+            self.add(item)
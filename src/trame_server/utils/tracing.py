@@ -0,0 +1,289 @@
+"""Lightweight tracing of trame interactions
+
+Spans follow the OpenTelemetry data model (trace/span ids, parent link,
+start/end time in nanoseconds, attributes and status) so they can be
+converted or forwarded later, but no external service or dependency is
+required. Finished spans are handed to exporters such as an in-memory ring
+buffer or a JSON lines file.
+
+Tracing is disabled by default and every instrumentation point then only costs
+a function call returning a shared no-op span.
+
+>>> from trame_server.utils import tracing
+>>> exporter = tracing.enable()
+>>> with tracing.span("my.work", size=3):
+...     pass
+>>> exporter.spans[0].name
+'my.work'
+"""
+
+import contextvars
+import json
+import random
+import time
+from collections import deque
+from pathlib import Path
+
+__all__ = [
+    "TRACER",
+    "JsonFileExporter",
+    "MemoryExporter",
+    "Span",
+    "Tracer",
+    "current_span",
+    "disable",
+    "enable",
+    "initialize_tracer",
+    "span",
+]
+
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+_CURRENT_SPAN = contextvars.ContextVar("trame_current_span", default=None)
+
+
+class Span:
+    """A timed operation within a trace"""
+
+    __slots__ = (
+        "_token",
+        "_tracer",
+        "attributes",
+        "end_time_unix_nano",
+        "name",
+        "parent_span_id",
+        "span_id",
+        "start_time_unix_nano",
+        "status",
+        "status_description",
+        "trace_id",
+    )
+
+    def __init__(self, tracer, name, parent=None, attributes=None):
+        self._tracer = tracer
+        self._token = None
+        self.name = name
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = STATUS_UNSET
+        self.status_description = None
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano = None
+
+    def set_attribute(self, key, value):
+        """Attach a key/value pair to the span"""
+        self.attributes[key] = value
+
+    def set_status(self, status, description=None):
+        """Set the span status (UNSET, OK, ERROR)"""
+        self.status = status
+        self.status_description = description
+
+    @property
+    def duration(self):
+        """Duration of the span in seconds or None if not ended yet"""
+        if self.end_time_unix_nano is None:
+            return None
+        return (self.end_time_unix_nano - self.start_time_unix_nano) / 1e9
+
+    def end(self):
+        """Close the span and hand it to the tracer exporters"""
+        if self.end_time_unix_nano is not None:
+            return
+        self.end_time_unix_nano = time.time_ns()
+        self._tracer._export(self)
+
+    def to_dict(self):
+        """OpenTelemetry like representation of the span"""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": {
+                "code": self.status,
+                "description": self.status_description,
+            },
+        }
+
+    def __enter__(self):
+        self._token = _CURRENT_SPAN.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if exc_value is not None:
+            self.set_status(STATUS_ERROR, repr(exc_value))
+        _CURRENT_SPAN.reset(self._token)
+        self.end()
+
+    def __repr__(self):
+        return f"Span({self.name}, {self.duration})"
+
+
+class _NoOpSpan:
+    """Shared span used when tracing is disabled"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_status(self, status, description=None):
+        pass
+
+    def end(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        pass
+
+
+NO_OP_SPAN = _NoOpSpan()
+
+
+class MemoryExporter:
+    """
+    Keep the latest finished spans in a ring buffer.
+
+    :param max_spans: Number of spans to keep
+    :type max_spans: int
+    """
+
+    def __init__(self, max_spans=10000):
+        self._spans = deque(maxlen=max_spans)
+
+    def export(self, span):
+        self._spans.append(span)
+
+    @property
+    def spans(self):
+        """Copy of the spans currently held"""
+        return list(self._spans)
+
+    def trace(self, trace_id):
+        """Return all the spans of a given trace ordered by start time"""
+        return sorted(
+            (s for s in self._spans if s.trace_id == trace_id),
+            key=lambda s: s.start_time_unix_nano,
+        )
+
+    def clear(self):
+        self._spans.clear()
+
+
+class JsonFileExporter:
+    """
+    Append each finished span as a JSON line into a local file.
+
+    :param path: Path of the file to write into
+    :type path: str
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+
+    def export(self, span):
+        if self._file is None:
+            # Line buffered so each span is on disk once exported
+            self._file = self.path.open(mode="a", buffering=1)
+        self._file.write(json.dumps(span.to_dict(), default=str))
+        self._file.write("\n")
+
+    def close(self):
+        """Close the file (reopened on the next export)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Tracer:
+    """Create spans and dispatch them to exporters once finished"""
+
+    def __init__(self):
+        self.enabled = False
+        self.exporters = []
+
+    def span(self, span_name, **attributes):
+        """
+        Create a span to use as context manager. The span started within
+        another one (same task or thread) will be attached as its child.
+        """
+        if not self.enabled:
+            return NO_OP_SPAN
+        return Span(self, span_name, _CURRENT_SPAN.get(), attributes)
+
+    def add_exporter(self, exporter):
+        self.exporters.append(exporter)
+        return exporter
+
+    def remove_exporter(self, exporter):
+        if exporter in self.exporters:
+            self.exporters.remove(exporter)
+
+    def _export(self, span):
+        for exporter in self.exporters:
+            exporter.export(span)
+
+
+TRACER = Tracer()
+
+
+def span(span_name, **attributes):
+    """Create a span on the default tracer"""
+    return TRACER.span(span_name, **attributes)
+
+
+def current_span():
+    """Return the active span or None"""
+    return _CURRENT_SPAN.get()
+
+
+def enable(exporter=None):
+    """
+    Enable tracing on the default tracer.
+
+    :param exporter: Exporter to register (default: new MemoryExporter)
+    :return: The registered exporter
+    """
+    if exporter is None:
+        exporter = MemoryExporter()
+
+    TRACER.add_exporter(exporter)
+    TRACER.enabled = True
+    return exporter
+
+
+def disable():
+    """Disable tracing and remove all exporters from the default tracer"""
+    TRACER.enabled = False
+    for exporter in TRACER.exporters:
+        close = getattr(exporter, "close", None)
+        if close is not None:
+            close()
+    TRACER.exporters.clear()
+
+
+def initialize_tracer(config):
+    """
+    Enable tracing from server options.
+    The "trace" option can either be "memory" or a path to a JSON lines file.
+    """
+    output = config.get("trace")
+    if not output or TRACER.enabled:
+        return
+
+    if output == "memory":
+        enable(MemoryExporter())
+    else:
+        enable(JsonFileExporter(output))
@@ -1,5 +1,9 @@
+import functools
 import inspect
+import sys
+import weakref
 from abc import ABC, abstractmethod
+from array import array
 from contextlib import contextmanager
 from dataclasses import MISSING, Field, fields, is_dataclass
 from datetime import date, datetime, time, timezone
@@ -24,6 +28,11 @@ from uuid import UUID
 
 from trame_server.state import State
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 T = TypeVar("T")
 V = TypeVar("V")
 
@@ -104,6 +113,78 @@ class DefaultEncoderDecoder(IStateEncoderDecoder):
         return obj_type(obj)
 
 
+def _identity(obj):
+    return obj
+
+
+def _encode_datetime(obj):
+    return obj.astimezone(timezone.utc).isoformat()
+
+
+# DefaultEncoderDecoder.encode branches, in the same order
+_DEFAULT_ENCODE_CONVERTERS = [
+    (UUID, str),
+    (Enum, lambda obj: obj.value),
+    (Decimal, str),
+    (datetime, _encode_datetime),
+    (date, lambda obj: obj.isoformat()),
+    (time, lambda obj: obj.isoformat()),
+    (Path, lambda obj: obj.as_posix()),
+]
+
+_CONTAINER_TYPES = (dict, list, tuple)
+
+# Marker for proxy fields which did not decode any value yet
+_NO_VALUE = object()
+
+# Maximum number of decoding plans kept for annotations which can not be hashed
+_MAX_UNHASHABLE_DECODE_PLANS = 256
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolved_fields(dataclass_type: type) -> list[tuple[Field, type]]:
+    """
+    Dataclass fields along with their resolved type.
+    Use type hints instead of field.type to avoid lazy evaluation of field.type when used in files containing
+    from __future__ import annotations header.
+    """
+    field_types = get_type_hints(dataclass_type)
+    return [(f, field_types[f.name]) for f in fields(dataclass_type)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_names_proxy(typed_state_cls, dataclass_type: type, namespace: str):
+    return typed_state_cls._build_state_names_proxy(dataclass_type, namespace)
+
+
+def _decode_plan_key(obj_type: Any) -> Any:
+    """
+    Hashable key of a type annotation or None if it can not be hashed.
+    Nested type arguments are part of the key as equal unions may list their members in a different order.
+    """
+    type_args = get_args(obj_type)
+    if not type_args:
+        key = obj_type
+    else:
+        arg_keys = tuple(_decode_plan_key(arg) for arg in type_args)
+        if None in arg_keys:
+            return None
+        key = (obj_type, arg_keys)
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _default_decode_converter(obj_type: type) -> Callable[[Any], Any]:
+    """Resolve the DefaultEncoderDecoder.decode conversion of a non None value not already of the given type"""
+    if issubclass(obj_type, (datetime, date, time)):
+        return obj_type.fromisoformat
+    return obj_type
+
+
 class CollectionEncoderDecoder(IStateEncoderDecoder):
     """
     Encoding/decoding for lists, tuples, dicts and type unions. Delegates to an encoder list for contained types.
@@ -117,8 +198,17 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
 
     def __init__(self, encoders: list[IStateEncoderDecoder] | None = None):
         self._encoders = encoders or [DefaultEncoderDecoder()]
+        self._encode_plans: dict[type, Callable[[Any], Any]] = {}
+        self._decode_plans: dict[Any, Callable[[Any], Any]] = {}
+        # Plans of unhashable annotations, keyed on their identity in a bounded LRU
+        self._unhashable_decode_plans: dict[int, tuple[Any, Callable[[Any], Any]]] = {}
 
     def encode(self, obj):
+        if isinstance(obj, type):
+            return self._encode_uncompiled(obj)
+        return self._encode_plan(type(obj))(obj)
+
+    def _encode_uncompiled(self, obj):
         if is_dataclass(obj):
             return {
                 field.name: self.encode(getattr(obj, field.name))
@@ -131,6 +221,9 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
         if self._is_iterable(obj):
             return type(obj)(self.encode(value) for value in obj)
 
+        return self._delegate_encode(obj)
+
+    def _delegate_encode(self, obj):
         for encoder in self._encoders:
             val = self._try_serialize(encoder.encode, obj)
             if self.is_serialization_success(val):
@@ -139,6 +232,76 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
         _error_msg = f"Failed to encode object {obj}. No appropriate encoder in {self._encoders}."
         raise TypeError(_error_msg)
 
+    def _encode_plan(self, obj_type: type) -> Callable[[Any], Any]:
+        """
+        Return the encoding function of the given value type, compiling it on first use.
+        The plan resolves once which strategy applies to the type instead of testing each of them on every value.
+        """
+        plan = self._encode_plans.get(obj_type)
+        if plan is None:
+            plan = self._compile_encode_plan(obj_type)
+            self._encode_plans[obj_type] = plan
+        return plan
+
+    def _compile_encode_plan(self, obj_type: type) -> Callable[[Any], Any]:
+        encode = self.encode
+
+        if is_dataclass(obj_type):
+            names = [field.name for field in fields(obj_type)]
+
+            def encode_dataclass(obj):
+                return {name: encode(getattr(obj, name)) for name in names}
+
+            return encode_dataclass
+
+        if issubclass(obj_type, dict):
+
+            def encode_dict(obj):
+                return {encode(key): encode(value) for key, value in obj.items()}
+
+            return encode_dict
+
+        if issubclass(obj_type, (list, tuple)):
+
+            def encode_iterable(obj):
+                return type(obj)(encode(value) for value in obj)
+
+            return encode_iterable
+
+        convert = self._default_converter(obj_type)
+        if convert is None:
+            return self._delegate_encode
+
+        if convert is _identity:
+            return convert
+
+        def encode_value(obj):
+            try:
+                return convert(obj)
+            except Exception:
+                return self._delegate_encode(obj)
+
+        return encode_value
+
+    def _default_converter(self, obj_type: type) -> Callable[[Any], Any] | None:
+        """
+        Resolve the DefaultEncoderDecoder.encode branch matching the type.
+        Returns None when the encoder list isn't the default one and the generic delegation is required.
+        """
+        if not self._has_default_encoders():
+            return None
+
+        for base, convert in _DEFAULT_ENCODE_CONVERTERS:
+            if issubclass(obj_type, base):
+                return convert
+        return _identity
+
+    def _has_default_encoders(self) -> bool:
+        return (
+            len(self._encoders) == 1
+            and type(self._encoders[0]) is DefaultEncoderDecoder
+        )
+
     @classmethod
     def _is_iterable(cls, obj):
         return isinstance(obj, list) or isinstance(obj, tuple)
@@ -158,77 +321,298 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
         raise TypeError(_error_msg)
 
     def _try_decode(self, obj, obj_type: type):
-        for decode in self._decode_strategies():
-            val = decode(obj, obj_type)
-            if self.is_serialization_success(val):
-                return val
-        return self.failed_serialization()
-
-    def _decode_strategies(self) -> list[Callable[[Any, type], Any]]:
-        return [
-            self._decode_dataclass,
-            self._decode_union,
-            self._decode_dict,
-            self._decode_iterable,
-            self._delegate_decode,
-        ]
+        return self._decode_plan(obj_type)(obj)
 
-    def _delegate_decode(self, obj, obj_type: type):
-        for encoder in self._encoders:
-            val = self._try_serialize(encoder.decode, obj, obj_type)
-            if self.is_serialization_success(val):
-                return val
-        return self.failed_serialization()
+    def _decode_plan(self, obj_type: type) -> Callable[[Any], Any]:
+        """
+        Return the decoding function of the given type, compiling it on first use.
+        The function returns either the decoded value or a serialization failure, with the same semantic as trying
+        each decoding strategy in order. Type hints, type arguments and union members are only inspected once.
+        """
+        key = _decode_plan_key(obj_type)
+        if key is not None:
+            plan = self._decode_plans.get(key)
+            if plan is None:
+                plan = self._compile_decode_plan(obj_type)
+                self._decode_plans[key] = plan
+            return plan
+
+        # Keep the annotation along with its plan so its id can not be reused
+        entry = self._unhashable_decode_plans.pop(id(obj_type), None)
+        if entry is None:
+            entry = (obj_type, self._compile_decode_plan(obj_type))
+            if len(self._unhashable_decode_plans) >= _MAX_UNHASHABLE_DECODE_PLANS:
+                # Drop least recently used entry
+                del self._unhashable_decode_plans[
+                    next(iter(self._unhashable_decode_plans))
+                ]
+        self._unhashable_decode_plans[id(obj_type)] = entry
+        return entry[1]
+
+    def _compile_decode_plan(self, obj_type: type) -> Callable[[Any], Any]:
+        if is_dataclass(obj_type):
+            return self._compile_dataclass_decoder(obj_type)
+
+        steps = []
+        if self._is_union_type(obj_type):
+            steps.append(self._compile_union_decoder(obj_type))
+        steps.append(self._compile_container_decoder(obj_type))
+        steps.extend(
+            self._compile_delegate_decoder(encoder, obj_type)
+            for encoder in self._encoders
+        )
 
-    def _decode_dict(self, obj, obj_type: type):
-        if not isinstance(obj, dict):
+        def decode(obj):
+            for step in steps:
+                val = step(obj)
+                if not isinstance(val, _SerializationFailure):
+                    return val
             return self.failed_serialization()
 
-        key_type, value_type = get_args(obj_type)
-        return {
-            self.decode(key, key_type): self.decode(value, value_type)
-            for key, value in obj.items()
-        }
+        is_plain_type = isinstance(obj_type, type) and get_origin(obj_type) is None
+        if len(steps) != 2 or not is_plain_type or not self._has_default_encoders():
+            return decode
+
+        # Fast path for plain types handled by the DefaultEncoderDecoder
+        convert = _default_decode_converter(obj_type)
+
+        def decode_value(obj):
+            if obj is None:
+                return None
+            if isinstance(obj, _CONTAINER_TYPES):
+                return decode(obj)
+            if isinstance(obj, obj_type):
+                return obj
+            try:
+                return convert(obj)
+            except Exception as e:
+                return self.failed_serialization(str(e))
+
+        return decode_value
+
+    def _compile_dataclass_decoder(self, obj_type: type) -> Callable[[Any], Any]:
+        resolved_fields = _resolved_fields(obj_type)
+        # Field plans are resolved on first call to support recursive dataclasses
+        field_plans = []
+
+        def decode_dataclass(obj):
+            if not field_plans:
+                field_plans.extend(
+                    (f.name, self._decode_plan(f_type)) for f, f_type in resolved_fields
+                )
+            return obj_type(**{name: plan(obj.get(name)) for name, plan in field_plans})
 
-    def _decode_iterable(self, obj, obj_type: type):
-        if not self._is_iterable(obj):
-            return self.failed_serialization()
+        return decode_dataclass
 
-        value_type = get_args(obj_type)[0]
-        return obj_type(self.decode(value, value_type) for value in obj)
+    def _compile_union_decoder(self, obj_type: type) -> Callable[[Any], Any]:
+        sub_types = get_args(obj_type)
 
-    def _decode_union(self, obj, obj_type: type):
-        if not self._is_union_type(obj_type):
-            return self.failed_serialization()
+        def decode_union(obj):
+            for sub_union_type in sub_types:
+                val = self._decode_plan(sub_union_type)(obj)
+                if not isinstance(val, _SerializationFailure):
+                    return val
+            return self._failure
 
-        for sub_union_type in get_args(obj_type):
-            val = self._try_decode(obj, sub_union_type)
-            if self.is_serialization_success(val):
-                return val
-        return self.failed_serialization()
+        return decode_union
 
-    def _decode_dataclass(self, obj, obj_type: type):
-        if not is_dataclass(obj_type):
-            return self.failed_serialization()
+    def _compile_container_decoder(self, obj_type: type) -> Callable[[Any], Any]:
+        type_args = get_args(obj_type)
+
+        def decode_element(obj, element_type, plan):
+            val = plan(obj)
+            if isinstance(val, _SerializationFailure):
+                return self.decode(obj, element_type)
+            return val
+
+        def decode_container(obj):
+            if isinstance(obj, dict):
+                key_type, value_type = type_args
+                key_plan = self._decode_plan(key_type)
+                value_plan = self._decode_plan(value_type)
+                return {
+                    decode_element(key, key_type, key_plan): decode_element(
+                        value, value_type, value_plan
+                    )
+                    for key, value in obj.items()
+                }
+
+            if isinstance(obj, (list, tuple)):
+                value_type = type_args[0]
+                value_plan = self._decode_plan(value_type)
+                return obj_type(
+                    decode_element(value, value_type, value_plan) for value in obj
+                )
+
+            return self._failure
 
-        field_types = get_type_hints(obj_type)
-        decoded_dict = {
-            field.name: self._try_decode(obj.get(field.name), field_types[field.name])
-            for field in fields(obj_type)
-        }
-        return obj_type(**decoded_dict)
+        return decode_container
+
+    def _compile_delegate_decoder(
+        self, encoder: IStateEncoderDecoder, obj_type: type
+    ) -> Callable[[Any], Any]:
+        def delegate_decode(obj):
+            try:
+                return encoder.decode(obj, obj_type)
+            except Exception as e:
+                return self.failed_serialization(str(e))
+
+        return delegate_decode
 
     @classmethod
     def _is_union_type(cls, obj_type: type):
         return get_origin(obj_type) is Union or isinstance(obj_type, UnionType)
 
 
+# Encoder shared by the typed states created without encoders so decoding plans and proxies can be reused
+_DEFAULT_ENCODER = CollectionEncoderDecoder()
+
+# Data proxies using the default encoder, per state
+_STATE_PROXIES = weakref.WeakKeyDictionary()
+
+
+_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+# NumPy like dtype (without byte order) to array module typecode
+_ARRAY_TYPECODES = {
+    "f4": "f",
+    "f8": "d",
+    "i1": "b",
+    "u1": "B",
+    "i2": "h",
+    "u2": "H",
+    "i4": "i",
+    "u4": "I",
+    "i8": "q",
+    "u8": "Q",
+}
+_ARRAY_DTYPES = {typecode: dtype for dtype, typecode in _ARRAY_TYPECODES.items()}
+_BUFFER_KEYS = {"dtype", "shape", "buffer"}
+
+
+class NumericBufferEncoderDecoder(CollectionEncoderDecoder):
+    """
+    Opt-in encoding of homogeneous numeric sequences as binary buffers.
+
+    Lists and tuples only made of floats (or only of ints fitting in int64) are stored in the state as
+    {"dtype": "<f8", "shape": [size], "buffer": bytes} using the array module, which avoids boxing each item when
+    encoding and publishing them. NumPy arrays of numbers are handled the same way when NumPy is available.
+    Fields declared as list, tuple or NumPy array decode such buffers back to the declared type, other values follow
+    the CollectionEncoderDecoder rules.
+
+    The client side receives the binary buffer instead of a list.
+
+    :param encoders: List of encoders to use for the non numeric values.
+    """
+
+    def _compile_encode_plan(self, obj_type: type) -> Callable[[Any], Any]:
+        plan = super()._compile_encode_plan(obj_type)
+
+        if np is not None and issubclass(obj_type, np.ndarray):
+
+            def encode_ndarray(obj):
+                if obj.dtype.kind not in "iuf":
+                    return plan(obj)
+                return {
+                    "dtype": obj.dtype.str,
+                    "shape": list(obj.shape),
+                    "buffer": obj.tobytes(),
+                }
+
+            return encode_ndarray
+
+        if not issubclass(obj_type, (list, tuple)):
+            return plan
+
+        def encode_sequence(obj):
+            values = self._to_array(obj)
+            if values is None:
+                return plan(obj)
+            return {
+                "dtype": _BYTE_ORDER + _ARRAY_DTYPES[values.typecode],
+                "shape": [len(values)],
+                "buffer": values.tobytes(),
+            }
+
+        return encode_sequence
+
+    @staticmethod
+    def _to_array(obj) -> array | None:
+        """
+        Pack a sequence made only of floats or only of ints fitting in int64 into an array.
+        None for any other sequence (mixed, bool or big ints) so it keeps its regular encoding and round trips exactly.
+        """
+        if not obj:
+            return None
+
+        item_type = type(obj[0])
+        if item_type is float:
+            typecode = "d"
+        elif item_type is int:
+            typecode = "q"
+        else:
+            return None
+
+        if not all(type(v) is item_type for v in obj):
+            return None
+
+        try:
+            return array(typecode, obj)
+        except OverflowError:
+            return None
+
+    def _compile_decode_plan(self, obj_type: type) -> Callable[[Any], Any]:
+        plan = super()._compile_decode_plan(obj_type)
+
+        origin = get_origin(obj_type) or obj_type
+        is_ndarray = (
+            np is not None
+            and isinstance(origin, type)
+            and issubclass(origin, np.ndarray)
+        )
+        if not is_ndarray and origin not in (list, tuple):
+            return plan
+
+        type_args = get_args(obj_type)
+        item_type = type_args[0] if type_args and not is_ndarray else None
+
+        def decode_buffer(obj):
+            if not isinstance(obj, dict) or obj.keys() != _BUFFER_KEYS:
+                return plan(obj)
+
+            if is_ndarray:
+                values = np.frombuffer(obj["buffer"], dtype=obj["dtype"])
+                return values.reshape(obj["shape"]).copy()
+
+            dtype = obj["dtype"]
+            typecode = _ARRAY_TYPECODES.get(dtype[1:])
+            if typecode is None:
+                return self.failed_serialization(f"Unsupported dtype {dtype}")
+
+            values = array(typecode)
+            values.frombytes(obj["buffer"])
+            if dtype[0] != _BYTE_ORDER:
+                values.byteswap()
+
+            items = values.tolist()
+            if item_type is float and values.typecode not in "fd":
+                items = [float(v) for v in items]
+            return obj_type(items)
+
+        return decode_buffer
+
+
 class _ProxyField:
     """
     Descriptor for proxy state fields to an equivalent dataclass field.
     If the dataclass provides default, or a default factory, the associated state will be initialized to the given
     encoded state value.
 
+    Decoded values are cached until the underlying state value gets replaced (identity check) or flagged with
+    state.dirty(). Consecutive reads therefore return the same object which should be considered read only:
+    modifying it in place is not reflected in the state and won't be discarded on the next read.
+    Assign a new value (or a modified copy) to update the state.
+
     :param state: Trame State which will be mutated / read from.
     :param state_id: Associated trame string id where the data will be pushed / read from.
     :param name: Name of the source field.
@@ -249,19 +633,34 @@ class _ProxyField:
         default_factory,
         state_encoder: IStateEncoderDecoder,
     ):
-        self._state = state
+        # Weak so the proxies cached per state don't keep it alive
+        self._state_ref = weakref.ref(state)
         self._state_id = state_id
         self._name = name
         self._default = default
+        self._default_factory = default_factory
         self._encoder = state_encoder
         self._type = field_type
-
-        # Set the default value to trame state if needed
-        default_value = default
-        if default_value == MISSING and default_factory != MISSING:
-            default_value = default_factory()
+        self._cached_state_value = _NO_VALUE
+        self._cached_dirty_version = None
+        self._cached_value = None
+        self.init_default()
+
+    def init_default(self):
+        """Set the default value to trame state if needed"""
+        default_value = self._default
+        if default_value == MISSING and self._default_factory != MISSING:
+            default_value = self._default_factory()
         if default_value != MISSING:
-            self._state.setdefault(self._state_id, self._encoder.encode(default_value))
+            self.state.setdefault(self._state_id, self._encoder.encode(default_value))
+
+    @property
+    def state(self) -> State:
+        return self._state_ref()
+
+    @property
+    def state_id(self) -> str:
+        return self._state_id
 
     def __get__(self, instance, owner):
         return self.get_value()
@@ -270,11 +669,26 @@ class _ProxyField:
         self.set_value(value)
 
     def get_value(self):
-        value = self._state[self._state_id]
-        return self._encoder.decode(value, self._type)
+        state = self._state_ref()
+        value = state[self._state_id]
+        dirty_version = state.dirty_version
+        if (
+            value is self._cached_state_value
+            and dirty_version == self._cached_dirty_version
+        ):
+            return self._cached_value
+
+        decoded = self._encoder.decode(value, self._type)
+        self._cached_state_value = value
+        self._cached_dirty_version = dirty_version
+        self._cached_value = decoded
+        return decoded
 
     def set_value(self, value):
-        self._state[self._state_id] = self._encoder.encode(value)
+        self.state[self._state_id] = self.encode(value)
+
+    def encode(self, value):
+        return self._encoder.encode(value)
 
 
 class _NameField:
@@ -317,7 +731,9 @@ class TypedState(Generic[T]):
         data: T | None = None,
         name: T | None = None,
     ):
-        self._encoder = encoder or CollectionEncoderDecoder(encoders)
+        self._encoder = encoder or (
+            CollectionEncoderDecoder(encoders) if encoders else _DEFAULT_ENCODER
+        )
         self.state = state
         self.data = data or self._create_state_proxy(
             dataclass_type=dataclass_type,
@@ -358,13 +774,14 @@ class TypedState(Generic[T]):
         """
         return self.as_dataclass(self.data)
 
-    def set_dataclass(self, data: T) -> None:
+    def set_dataclass(self, data: T, *, flush: bool = False) -> None:
         """
         Set the content of the typed state from the input dataclass.
         Dataclass instance needs to match the dataclass type the typed state was constructed from.
         :param data: Instance of dataclass matching the typed state type.
+        :param flush: If True, flush the state once updated so all the changes are pushed together.
         """
-        self.from_dataclass(self.data, data)
+        self.from_dataclass(self.data, data, flush=flush)
 
     @classmethod
     def _create_state_proxy(
@@ -385,8 +802,19 @@ class TypedState(Generic[T]):
             namespace prefix.
         :param encoder: Optional encoder/decoder from dataclass field to trame state field. If not encoder is
             provided, will use a default encoder/decoder.
+
+        Proxies using the default encoder are cached per state, dataclass type and namespace. On reuse, the field
+        defaults are applied again for the keys missing from the state.
         """
-        encoder = encoder or CollectionEncoderDecoder(None)
+        encoder = encoder or _DEFAULT_ENCODER
+        cacheable = encoder is _DEFAULT_ENCODER
+        key = (cls, dataclass_type, namespace)
+        proxies = _STATE_PROXIES.get(state)
+        if cacheable and proxies is not None and key in proxies:
+            proxy, proxy_fields = proxies[key]
+            for proxy_field in proxy_fields:
+                proxy_field.init_default()
+            return proxy
 
         def handler(state_id: str, field: Field, field_type: type):
             return _ProxyField(
@@ -399,19 +827,31 @@ class TypedState(Generic[T]):
                 state_encoder=encoder,
             )
 
-        return cls._build_proxy_cls(dataclass_type, namespace, handler, "__Proxy")
+        proxy = cls._build_proxy_cls(dataclass_type, namespace, handler, "__Proxy")
+        proxy_fields = [
+            field
+            for field in cls.get_field_proxy_dict(proxy).values()
+            if isinstance(field, _ProxyField)
+        ]
+        if cacheable:
+            _STATE_PROXIES.setdefault(state, {})[key] = (proxy, proxy_fields)
+        return proxy
 
     @classmethod
     def _create_state_names_proxy(cls, dataclass_type: Type[T], *, namespace="") -> T:
         """
         Returns a State proxy with the same field structure as the input dataclass and for each field returning the
         fully qualified state id name associated with a dataclass leaf.
+        Name proxies only depend on their inputs and are shared between typed states.
 
         :param dataclass_type: Type of dataclass for which the proxy will be created.
         :param namespace: Optional namespace for the trame state. All proxy field access will be using this
             namespace prefix.
         """
+        return _cached_names_proxy(cls, dataclass_type, namespace)
 
+    @classmethod
+    def _build_state_names_proxy(cls, dataclass_type: Type[T], namespace: str) -> T:
         def handler(state_id: str, _field: Field, _field_type: type):
             return _NameField(state_id=state_id)
 
@@ -443,12 +883,8 @@ class TypedState(Generic[T]):
         inner_field_dict = {}
         prefix = f"{prefix}__{class_name}" if prefix else class_name
 
-        # Use type hints instead of field.type to avoid lazy evaluation of field.type when used in files containing
-        # from __future__ import annotations header.
-        field_types = get_type_hints(dataclass_type)
-        for f in fields(dataclass_type):
+        for f, f_type in _resolved_fields(dataclass_type):
             state_id = f"{prefix}__{f.name}"
-            f_type = field_types[f.name]
             if is_dataclass(f_type):
                 field = cls._build_proxy_cls(
                     f_type, state_id, handler, cls_suffix, inner_field_dict
@@ -539,9 +975,33 @@ class TypedState(Generic[T]):
         return dataclass_type(**kwargs)
 
     @classmethod
-    def from_dataclass(cls, instance: T, dataclass_obj: T) -> None:
+    def from_dataclass(
+        cls, instance: T, dataclass_obj: T, *, flush: bool = False
+    ) -> None:
         """
         Populate the state proxy instance from the values of the given dataclass object.
+        All the leaf values are encoded first and only the ones differing from the current state values are applied
+        using a single state update.
+
+        :param instance: State proxy instance to populate.
+        :param dataclass_obj: Dataclass object matching the proxy dataclass type.
+        :param flush: If True, flush the state once updated so all the changes are pushed together.
+        """
+        changes: dict[State, dict[str, Any]] = {}
+        cls._collect_changes(instance, dataclass_obj, changes)
+
+        for state, state_changes in changes.items():
+            if state_changes:
+                state.update(state_changes)
+            if flush:
+                state.flush()
+
+    @classmethod
+    def _collect_changes(
+        cls, instance: T, dataclass_obj: T, changes: dict[State, dict[str, Any]]
+    ) -> None:
+        """
+        Encode the dataclass object leaf values and gather the ones which differ from the state, grouped by state.
         """
         dataclass_type = cls._get_proxy_dataclass_type_or_raise(instance)
 
@@ -549,12 +1009,19 @@ class TypedState(Generic[T]):
             _error_msg = f"Expected instance of {dataclass_type.__name__}, got {type(dataclass_obj).__name__}"
             raise TypeError(_error_msg)
 
+        proxy_attrs = vars(type(instance))
         for f in fields(dataclass_type):
-            attr = getattr(instance, f.name)
+            attr = proxy_attrs[f.name]
             value = getattr(dataclass_obj, f.name)
 
             if cls.is_proxy_class(attr):
-                cls.from_dataclass(attr, value)
+                cls._collect_changes(attr, value, changes)
+            elif isinstance(attr, _ProxyField):
+                state, state_id = attr.state, attr.state_id
+                state_changes = changes.setdefault(state, {})
+                encoded = attr.encode(value)
+                if not state.has(state_id) or state[state_id] != encoded:
+                    state_changes[state_id] = encoded
             else:
                 setattr(instance, f.name, value)
 
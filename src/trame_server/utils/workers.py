@@ -0,0 +1,263 @@
+"""Process pool attached to a server
+
+Jobs run in worker processes with a WorkerState connected to the server
+state, so they can push updates, read the keys they declared and report
+their progress. Each job status lives in the reserved state key
+``trame__job_<id>`` as a dict with "status", "progress" and "message".
+That key gets removed once the job is forgotten, either explicitly or
+after the pool status_ttl.
+
+>>> job = server.workers.submit(solve, 10, keys=["resolution"])
+>>> job.cancel()
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .asynchronous import StateBridge, WorkerState
+
+__all__ = [
+    "Job",
+    "WorkerPool",
+]
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_ERROR = "error"
+STATUS_CANCELLED = "cancelled"
+
+# Seconds to wait for the updates of a job whose process did not exit cleanly
+BRIDGE_CLOSE_TIMEOUT = 5
+
+
+def _run_job(func, endpoint, args, kwargs):
+    """Entry point executed inside the worker process"""
+    with WorkerState(endpoint) as state:
+        state.set_progress(None)
+        return func(state, *args, **kwargs)
+
+
+def _warm_up():
+    return os.getpid()
+
+
+class Job:
+    """
+    Handle on a job submitted to a WorkerPool.
+    Awaiting the job returns the function result once all the state
+    updates sent by the job got applied.
+    """
+
+    def __init__(self, pool, job_id, bridge):
+        self.id = job_id
+        self.status_key = bridge.endpoint.status_key
+        self._pool = pool
+        self._bridge = bridge
+        self._process_future = None
+        self._future = None
+        self._forget_handle = None
+        self._completed = asyncio.get_running_loop().create_future()
+
+    @property
+    def status(self):
+        """Current status (pending, running, done, error or cancelled)"""
+        return (self._pool.server.state[self.status_key] or {}).get("status")
+
+    @property
+    def done(self):
+        return self._completed.done()
+
+    def cancel(self):
+        """
+        Cancel the job. A job not started yet is removed from the pool queue
+        while a running one gets notified through WorkerState.cancelled.
+        """
+        if self._future.done():
+            return
+
+        # Only succeeds when the job did not start yet
+        if self._process_future.cancel():
+            return
+
+        self._bridge.cancel()
+
+    def forget(self):
+        """
+        Remove the status key of a completed job from the state.
+        Clients see the status set to None.
+        """
+        if not self.done:
+            msg = f"Job {self.id} is not completed"
+            raise RuntimeError(msg)
+
+        if self._forget_handle is not None:
+            self._forget_handle.cancel()
+            self._forget_handle = None
+
+        state = self._pool.server.state
+        if not state.has(self.status_key):
+            return
+
+        with state:
+            state[self.status_key] = None
+        state.remove(self.status_key)
+
+    def _attach(self, process_future):
+        self._process_future = process_future
+        self._future = asyncio.wrap_future(process_future)
+        self._future.add_done_callback(self._on_future_done)
+        self._bridge.add_done_callback(self._on_bridge_closed)
+
+    def _on_future_done(self, future):
+        if future.cancelled():
+            self._bridge.close()
+        elif not self._bridge.done:
+            # The worker closes the bridge when exiting, unless it crashed
+            asyncio.get_running_loop().call_later(
+                BRIDGE_CLOSE_TIMEOUT, self._bridge.close
+            )
+        self._complete()
+
+    def _on_bridge_closed(self, _bridge):
+        self._complete()
+
+    def _complete(self):
+        """Report the final status once the job ended and its updates got applied"""
+        if not (self._future.done() and self._bridge.done) or self.done:
+            return
+
+        self._pool._jobs.pop(self.id, None)
+        future = self._future
+        if future.cancelled() or self._bridge.cancel_requested:
+            status = STATUS_CANCELLED
+        elif future.exception() is not None:
+            status = STATUS_ERROR
+            logger.error("Job %s failed", self.id, exc_info=future.exception())
+        else:
+            status = STATUS_DONE
+
+        state = self._pool.server.state
+        with state:
+            state[self.status_key] = {
+                **(state[self.status_key] or {}),
+                "status": status,
+            }
+
+        if self._pool.status_ttl is not None:
+            self._forget_handle = asyncio.get_running_loop().call_later(
+                self._pool.status_ttl, self.forget
+            )
+
+        if future.cancelled():
+            self._completed.cancel()
+        elif future.exception() is not None:
+            self._completed.set_exception(future.exception())
+            # Already logged, don't warn when nobody awaits the job
+            self._completed.exception()
+        else:
+            self._completed.set_result(future.result())
+
+    def __await__(self):
+        return self._completed.__await__()
+
+
+class WorkerPool:
+    """
+    Process pool owned by a server.
+
+    The number of processes comes from the ``--trame-workers`` command line
+    argument, the ``workers`` server option (or TRAME_WORKERS environment
+    variable) and defaults to the number of CPUs. Processes are spawned and
+    reused across jobs. The pool gets shut down when the server exits.
+
+    :param server: Server whose state is exposed to the jobs
+    :type server: trame_server.core.Server
+
+    :param max_workers: Number of processes
+    :type max_workers: int
+
+    :param status_ttl: Seconds after which the status key of a completed job
+                       gets removed from the state (None to keep it until
+                       Job.forget is called)
+    :type status_ttl: float
+    """
+
+    def __init__(self, server, max_workers=None, status_ttl=60):
+        self.server = server
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.status_ttl = status_ttl
+        self._executor = None
+        self._jobs = {}
+        self._job_ids = itertools.count(1)
+
+    @property
+    def executor(self):
+        """The underlying ProcessPoolExecutor (created on first use)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    @property
+    def jobs(self):
+        """Jobs not completed yet"""
+        return list(self._jobs.values())
+
+    def warm_up(self):
+        """
+        Start all the worker processes ahead of time so the first jobs
+        don't pay for their spawn.
+
+        :return: Future resolved once every process is up
+        """
+        loop = asyncio.get_running_loop()
+        return asyncio.gather(
+            *(
+                loop.run_in_executor(self.executor, _warm_up)
+                for _ in range(self.max_workers)
+            )
+        )
+
+    def submit(self, func, *args, keys=(), **kwargs):
+        """
+        Run func(state, *args, **kwargs) in a worker process where state is
+        a WorkerState connected to the server state.
+        Must be called from the server event loop.
+
+        :param func: Picklable function (defined at a module level)
+        :param keys: State names the job can read and listen to
+
+        :return: The job handle
+        :rtype: Job
+        """
+        job_id = next(self._job_ids)
+        bridge = StateBridge(self.server, keys, status_key=f"trame__job_{job_id}")
+        job = Job(self, job_id, bridge)
+
+        with self.server.state as state:
+            state[job.status_key] = {
+                "status": STATUS_PENDING,
+                "progress": None,
+                "message": None,
+            }
+
+        self._jobs[job_id] = job
+        job._attach(self.executor.submit(_run_job, func, bridge.endpoint, args, kwargs))
+        return job
+
+    def shutdown(self, wait=False):
+        """Cancel every job and stop the worker processes"""
+        for job in self.jobs:
+            job.cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
@@ -1,11 +1,22 @@
 import asyncio
 import multiprocessing
+import threading
 import time
+from array import array
 from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from queue import Queue
 
 import pytest
 from trame.app import asynchronous, get_server
 
+from trame_server.utils.asynchronous import (
+    SharedBuffer,
+    StateBridge,
+    WorkerState,
+    _read_queue,
+)
+
 
 @pytest.mark.asyncio
 async def test_thread_state_sync():
@@ -61,7 +72,8 @@ async def test_thread_state_sync():
             exec_in_thread(queue),
         )
     )
-    asynchronous.create_state_queue_monitor_task(server, queue)
+    # Every intermediate value is expected
+    asynchronous.create_state_queue_monitor_task(server, queue, coalesce=False)
 
     previous_size = len(value_changes)
     while len(value_changes) < 10:
@@ -90,3 +102,187 @@ async def test_task_decorator():
     assert bg_update == "idle"
     await asyncio.sleep(0.1)
     assert bg_update == "ok"
+
+
+@pytest.mark.asyncio
+async def test_state_queue_monitor_batches():
+    server = get_server("test_state_queue_monitor_batches")
+    server.state.ready()
+    changes = []
+
+    @server.state.change("a", "b")
+    def on_change(a, b, **_):
+        changes.append((a, b))
+
+    # Thread queue so puts are immediately visible to the reader thread
+    queue = Queue()
+    state = asynchronous.StateQueue(queue)
+    state.a = 1
+    state.b = 1
+    state.a = 2
+
+    # Long delay does not slow down updates, intermediate values kept
+    monitor = asynchronous.create_state_queue_monitor_task(
+        server, queue, delay=10, coalesce=False
+    )
+    await asyncio.sleep(0.2)
+    assert changes == [(1, 1), (2, 1)]
+
+    state.update({"a": 3, "b": 3})
+    state.b = 4
+    await asyncio.sleep(0.2)
+    assert changes[2:] == [(3, 3), (3, 4)]
+
+    # Merged per key by default
+    coalesce_queue = Queue()
+    coalesce_monitor = asynchronous.create_state_queue_monitor_task(
+        server, coalesce_queue, delay=0.1
+    )
+    with asynchronous.StateQueue(coalesce_queue) as state:
+        for i in range(5, 10):
+            state.a = i
+    await asyncio.sleep(0.2)
+    assert changes[4:] == [(9, 4)]
+    assert coalesce_monitor.done()
+
+    monitor.cancel()
+
+
+def test_state_queue_max_rate():
+    queue = Queue()
+    state = asynchronous.StateQueue(queue, max_rate=10)
+    for i in range(1000):
+        state.progress = i
+    state.message = "done"
+
+    # First change goes out right away, the others within the next window
+    assert queue.get_nowait() == {"progress": 0}
+    assert queue.empty()
+    assert state.progress == 999
+    assert queue.get(timeout=1) == {"progress": 999, "message": "done"}
+
+    state.progress = 1000
+    state.exit()
+    assert queue.get_nowait() == {"progress": 1000}
+    assert queue.get_nowait() == "STOP"
+
+
+@pytest.mark.asyncio
+async def test_state_queue_shared_memory():
+    server = get_server("test_state_queue_shared_memory")
+    server.state.ready()
+
+    queue = multiprocessing.Queue()
+    state = asynchronous.StateQueue(queue, shared_memory_threshold=1024)
+    blob = bytes(range(256)) * 64
+    values = array("d", range(1000))
+
+    state.update({"blob": blob, "values": values, "small": b"abc"})
+    (message,) = [queue.get(timeout=1)]
+    assert isinstance(message["blob"], SharedBuffer)
+    assert isinstance(message["values"], SharedBuffer)
+    assert message["small"] == b"abc"
+    assert state.blob is blob
+
+    queue.put(message)
+    monitor = asynchronous.create_state_queue_monitor_task(server, queue, delay=0.1)
+    await asyncio.sleep(0.2)
+
+    assert server.state.blob == blob
+    assert server.state.values == values
+    assert server.state.small == b"abc"
+
+    # Segments got released once loaded
+    for handle in (message["blob"], message["values"]):
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle.name)
+
+    monitor.cancel()
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_state_queue_shared_memory_released_on_cancel():
+    server = get_server("test_state_queue_shared_memory_released_on_cancel")
+    server.state.ready()
+
+    queue = Queue()
+    monitor = asynchronous.create_state_queue_monitor_task(server, queue, delay=0.05)
+    await asyncio.sleep(0.01)
+
+    # Cancelled while messages are on their way to the loop or still queued
+    handles = [SharedBuffer.create(bytes(64)) for _ in range(3)]
+    for handle in handles:
+        queue.put({"first": handle})
+    monitor.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await monitor
+    await asyncio.sleep(0.2)
+    assert server.state.first is None
+
+    # Messages read but not applied are released, others are left queued
+    queued = set()
+    while not queue.empty():
+        queued.add(queue.get()["first"].name)
+    for handle in handles:
+        if handle.name in queued:
+            assert handle.load() == bytes(64)
+        else:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=handle.name)
+
+
+def test_state_queue_reader_leaves_queued_messages():
+    queue = Queue()
+    handle = SharedBuffer.create(bytes(8))
+    queue.put({"first": handle})
+
+    # Reader stopped before reading anything
+    stop_event = threading.Event()
+    stop_event.set()
+    _read_queue(queue, None, None, stop_event, 0.01)
+
+    assert SharedBuffer.load_all(queue.get_nowait()) == {"first": bytes(8)}
+
+
+@pytest.mark.asyncio
+async def test_state_bridge():
+    server = get_server("test_state_bridge")
+    server.state.ready()
+    server.state.resolution = 1
+
+    to_worker = Queue()
+    bridge = StateBridge(server, ["resolution"], to_server=Queue(), to_worker=to_worker)
+    worker = WorkerState(bridge.endpoint)
+    resolutions = []
+
+    @worker.change("resolution")
+    def on_resolution(resolution, **_):
+        resolutions.append(resolution)
+
+    assert await asyncio.to_thread(worker.poll, 1) == ["resolution"]
+    assert worker.resolution == 1
+
+    server.state.resolution = 5
+    server.state.flush()
+    assert await asyncio.to_thread(worker.poll, 1) == ["resolution"]
+    assert resolutions == [1, 5]
+    assert not worker.cancelled
+
+    worker.progress = 10
+    await asyncio.sleep(0.1)
+    assert server.state.progress == 10
+
+    bridge.cancel()
+    await asyncio.to_thread(worker.poll, 1)
+    assert worker.cancelled
+
+    worker.exit()
+    await asyncio.sleep(0.2)
+    assert bridge.done
+
+    # No more updates once closed
+    server.state.resolution = 6
+    server.state.flush()
+    await asyncio.sleep(0.2)
+    assert not [msg for msg in to_worker.queue if isinstance(msg, dict)]
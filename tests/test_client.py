@@ -5,6 +5,8 @@ import pytest
 import pytest_asyncio
 from trame.app import asynchronous, get_client, get_server
 
+from trame_server.client import Client
+
 
 @pytest_asyncio.fixture
 async def server():
@@ -87,3 +89,98 @@ async def test_given_suppress_listeners_sends_updates_to_client_only(server, cli
 
     assert client.state[state_key] == 42
     on_call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_client_reconnect(server):
+    client = Client(
+        f"ws://localhost:{server.port}/ws",
+        config={"secret": "wslink-secret"},
+        reconnect=True,
+        retry_delay=0.2,
+    )
+    statuses = []
+    client.on_connection_change(statuses.append)
+    events = []
+    client.subscribe("custom.topic", events.append)
+
+    @server.trigger("echo")
+    def echo(value):
+        return value
+
+    server.state.resync_a = 1
+    server.state.flush()
+    connection = asynchronous.create_task(client.connect())
+    for _ in range(10):
+        if client.connected == Client.CONNECTED:
+            break
+        await asyncio.sleep(0.1)
+    assert client.state.resync_a == 1
+
+    # Drop the connection without asking the client to stop
+    await client._session.ws.close()
+    await asyncio.sleep(0.05)
+    assert client.connected == Client.RECONNECTING
+
+    server.state.resync_a = 2
+    server.state.flush()
+    client.state.resync_b = 3
+    client.state.flush()
+    assert await client.call_trigger("echo", [4]) == 4
+    assert client.connected == Client.CONNECTED
+    assert client.state.resync_a == 2
+    await asyncio.sleep(0.1)
+    assert server.state.resync_b == 3
+
+    server.protocol.publish("custom.topic", {"value": 5})
+    await asyncio.sleep(0.1)
+    assert events == [{"value": 5}]
+
+    await client.disconnect()
+    await connection
+    assert statuses == [
+        Client.CONNECTING,
+        Client.CONNECTED,
+        Client.RECONNECTING,
+        Client.CONNECTED,
+        Client.DISCONNECTED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_concurrent_calls(server):
+    client = Client(
+        f"ws://localhost:{server.port}/ws",
+        config={"secret": "wslink-secret"},
+        max_in_flight=8,
+    )
+    in_flight = []
+
+    @server.trigger("slow_double")
+    async def slow_double(value, delay=0):
+        in_flight.append(len(client._session.in_flight_rpc))
+        await asyncio.sleep(delay)
+        return 2 * value
+
+    connection = asynchronous.create_task(client.connect())
+    for _ in range(10):
+        if client.connected == Client.CONNECTED:
+            break
+        await asyncio.sleep(0.1)
+
+    results = await asyncio.gather(
+        *(client.call_trigger("slow_double", [i]) for i in range(200))
+    )
+    assert results == [2 * i for i in range(200)]
+    assert max(in_flight) == 8
+
+    with pytest.raises(asyncio.TimeoutError, match="No response"):
+        await client.call_trigger("slow_double", [1], {"delay": 0.5}, timeout=0.1)
+    assert client._session.in_flight_rpc == {}
+
+    # Late response is ignored
+    await asyncio.sleep(0.5)
+    assert await client.call_trigger("slow_double", [2]) == 4
+
+    await client.disconnect()
+    await connection
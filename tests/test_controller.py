@@ -109,6 +109,63 @@ def test_weakrefs(controller):
     assert Obj.method_call_count == 1
 
 
+def test_weak_registration(controller, caplog):
+    caplog.set_level(logging.WARNING)
+
+    class Owner:
+        count = 0
+
+        def __init__(self):
+            Owner.count += 1
+
+        def __del__(self):
+            Owner.count -= 1
+
+        def on_data(self):
+            return 1
+
+        async def on_data_task(self):
+            return 2
+
+        def on_click(self):
+            return 3
+
+    owner = Owner()
+    controller.weak_fn.add(owner.on_data, weak=True)
+    controller.weak_fn.once(owner.on_data, weak=True)
+    name = controller.trigger_name(owner.on_click, weak=True)
+    assert controller.trigger_name(owner.on_click) == name
+    assert controller.trigger_fn(name)() == 3
+    assert controller.weak_fn() == [1, 1]
+
+    controller.weak_fn.add_task(owner.on_data_task, weak=True)
+
+    controller.weak_fn.remove(owner.on_data)
+    controller.weak_fn.discard(owner.on_data_task)
+    assert not controller.weak_fn.exists()
+
+    controller.weak_fn.add(owner.on_data, weak=True)
+    controller.weak_fn.add_task(owner.on_data_task, weak=True)
+    del owner
+    assert Owner.count == 0
+    assert not controller.weak_fn.exists()
+    assert controller.trigger_fn(name) is None
+
+    n_triggers = len(controller._triggers)
+    for _ in range(100000):
+        owner = Owner()
+        controller.leak.add(owner.on_data, weak=True)
+        controller.leak.add_task(owner.on_data_task, weak=True)
+        controller.trigger_name(owner.on_click, weak=True)
+    del owner
+
+    assert Owner.count == 0
+    assert not controller.leak.exists()
+    assert len(controller._triggers) == n_triggers
+    assert len(controller._triggers_fn2name) == n_triggers
+    assert Owner._trame_trigger_method_names == ["on_click"]
+
+
 @pytest.mark.asyncio
 async def test_tasks(controller):
     @controller.add("async_fn")
@@ -184,3 +241,171 @@ def test_child_controller(controller, server):
     assert child_controller.func() == [3, 2, 2.5]
     assert child_controller.func() == [3, 2]
     assert child_controller.func() == controller.child_func()
+
+
+def test_execution_order(controller):
+    calls = []
+
+    def make_fn(i):
+        def fn():
+            calls.append(i)
+            return i
+
+        return fn
+
+    fns = [make_fn(i) for i in range(10)]
+    for fn in reversed(fns):
+        controller.ordered.add(fn)
+
+    assert controller.ordered() == list(reversed(range(10)))
+    assert calls == list(reversed(range(10)))
+
+    # Plan get refreshed on any registration change
+    controller.ordered.discard(fns[5])
+    assert 5 not in controller.ordered()
+
+    controller.ordered = fns[0]
+    assert controller.ordered() == [0, *[i for i in reversed(range(10)) if i != 5]]
+
+    controller.ordered.clear(set_only=True)
+    assert controller.ordered() == 0
+
+    controller.ordered.once(fns[1])
+    assert controller.ordered() == [0, 1]
+    assert controller.ordered() == 0
+
+
+@pytest.mark.asyncio
+async def test_call_async(controller):
+    running = []
+    max_running = []
+
+    async def wait(value, delay):
+        running.append(value)
+        max_running.append(len(running))
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            running.remove(value)
+        return value
+
+    def sync_fn(*_):
+        return 1
+
+    def sync_coroutine(delay):
+        return wait(2, delay)
+
+    def failing(*_):
+        msg = "failure"
+        raise ValueError(msg)
+
+    async def task_3(delay):
+        return await wait(3, delay)
+
+    async def task_slow(delay):
+        return await wait(4, 10 * delay)
+
+    controller.gather = sync_fn
+    controller.gather.add(sync_coroutine)
+    controller.gather.add(failing)
+    controller.gather.add_task(task_3)
+    controller.gather.add_task(task_slow)
+
+    results = await controller.gather.call_async(0.01)
+    assert [r.func for r in results] == [
+        sync_fn,
+        sync_coroutine,
+        failing,
+        task_3,
+        task_slow,
+    ]
+    assert [r.value for r in results] == [1, 2, None, 3, 4]
+    assert [r.ok for r in results] == [True, True, False, True, True]
+    assert isinstance(results[2].error, ValueError)
+    assert [r.task for r in results] == [False, False, False, True, True]
+    assert max(max_running) == 3
+
+    max_running.clear()
+    results = await controller.gather.call_async(0.01, limit=1, timeout=0.05)
+    assert max(max_running) == 1
+    assert [r.timed_out for r in results] == [False, False, False, False, True]
+    assert not running
+
+    controller.gather.clear()
+    with pytest.raises(FunctionNotImplementedError):
+        await controller.gather.call_async()
+    assert await controller.gather.enable_empty().call_async() == []
+
+
+@pytest.mark.asyncio
+async def test_scheduling_policy(controller):
+    debounced = []
+    throttled = []
+    rendered = []
+
+    def on_resize(size):
+        debounced.append(size)
+
+    def on_move(position):
+        throttled.append(position)
+
+    controller.on_resize.add(on_resize, debounce=0.05)
+    controller.on_move.add(on_move, throttle_hz=20)
+
+    for i in range(10):
+        controller.on_resize(i)
+        controller.on_move(i)
+        await asyncio.sleep(0.01)
+
+    await asyncio.sleep(0.1)
+    assert debounced == [9]
+    assert throttled[0] == 0
+    assert throttled[-1] == 9
+    assert len(throttled) < 5
+
+    zoomed = []
+
+    @controller.add_task("on_zoom", debounce=0.05)
+    async def on_zoom(level):
+        zoomed.append(level)
+
+    controller.on_zoom(1)
+    controller.on_zoom(2)
+    await asyncio.sleep(0.1)
+    assert zoomed == [2]
+
+    # Pending calls are dropped along with their function
+    controller.on_zoom(3)
+    controller.on_zoom.discard(on_zoom)
+    controller.on_zoom.add_task(on_zoom, debounce=0.05)
+    controller.on_zoom(4)
+    controller.on_zoom.clear()
+    controller.on_resize(10)
+    controller.on_resize.remove(on_resize)
+    await asyncio.sleep(0.1)
+    assert zoomed == [2]
+    assert debounced == [9]
+    controller.on_resize.add(on_resize, debounce=0.05)
+
+    # Still reachable with the original function
+    controller.on_resize.discard(on_resize)
+    assert not controller.on_resize.exists()
+
+    # Policy over the whole chain
+    controller.render = rendered.append
+    controller.render.set_policy(debounce=0.05)
+    controller.render(1)
+    controller.render(2)
+    assert controller.render.policy.pending
+    controller.render.policy.flush()
+    assert rendered == [2]
+
+    controller.render(3)
+    controller.render.set_policy()
+    await asyncio.sleep(0.1)
+    assert rendered == [2]
+    controller.render(4)
+    assert rendered == [2, 4]
+
+    with pytest.raises(ValueError, match="debounce or throttle_hz"):
+        controller.render.set_policy(debounce=1, throttle_hz=1)
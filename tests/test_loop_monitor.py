@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+import pytest
+from trame.app import get_server
+
+from trame_server.utils.loop_monitor import LoopLagMonitor
+
+
+def blocking_call():
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_reports_blocking_call():
+    reports = []
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.1)
+    monitor.add_listener(reports.append)
+    monitor.start()
+    assert monitor.running
+
+    await asyncio.sleep(0.1)
+    blocking_call()
+    await asyncio.sleep(0.1)
+    monitor.stop()
+    assert not monitor.running
+
+    assert len(reports) == 1
+    assert reports[0]["lag"] >= 0.1
+    assert "blocking_call" in reports[0]["stack"]
+    assert monitor.reports == reports
+
+    stats = monitor.stats()
+    assert stats["count"] > 1
+    assert stats["blocked"] == 1
+    assert stats["max"] >= 0.2
+    assert stats["p50"] <= stats["p90"] <= stats["p99"] <= stats["max"]
+    assert list(monitor.percentiles(75)) == [75]
+
+    monitor.clear()
+    assert monitor.samples == []
+    assert monitor.percentiles() == {50: 0.0, 90: 0.0, 99: 0.0}
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_on_server():
+    server = get_server("test_loop_monitor_on_server", loop_lag_threshold=0.5)
+    child_server = server.create_child_server(prefix="child_")
+    assert server.loop_monitor is None
+
+    server.start(exec_mode="task", port=0)
+    assert await server.ready
+
+    assert server.loop_monitor is server.context.loop_monitor
+    assert child_server.loop_monitor is server.loop_monitor
+    assert server.loop_monitor.running
+    assert server.loop_monitor.threshold == 0.5
+
+    await asyncio.sleep(0.1)
+    await server.stop()
+    assert not server.context.loop_monitor.running
+
+    # Monitoring resumes when the server is started again
+    monitor = server.loop_monitor
+    server.start(exec_mode="task", port=0)
+    assert await server.ready
+    assert server.loop_monitor is monitor
+    assert monitor.running
+
+    await asyncio.sleep(0.1)
+    await server.stop()
+    assert not monitor.running
@@ -2,6 +2,8 @@ from trame.app import get_server
 from trame.ui.html import DivLayout
 from trame.widgets import html
 
+from trame_server.utils.namespace import NamespaceIndex
+
 
 def test_namespace_template():
     server = get_server("test_namespace_template")
@@ -14,3 +16,25 @@ def test_namespace_template():
 
     assert layout.html == "<div >\n<div >\n{{ child_a }}\n</div>\n</div>"
     assert child_server.translator("a") == "child_a"
+
+
+def test_namespace_index_match():
+    index = NamespaceIndex()
+    for i in range(200):
+        index.register(f"child_{i}_")
+    index.register("a_")
+    index.register("a_b_")
+
+    assert index.match("a_b_c") == "a_b_"
+    assert index.match("a_c") == "a_"
+    assert index.match("child_12_x") == "child_12_"
+    assert index.match("child_x") is None
+    assert index.prefixes[:2] == ["child_100_", "child_101_"]
+
+    index.add_key("a_b_c")
+    assert index.get("a_b_") == ["a_b_c"]
+
+    assert index.unregister("a_b_") == ["a_b_c"]
+    assert index.match("a_b_c") == "a_"
+    index.unregister("a_")
+    assert index.match("a_b_c") is None
@@ -245,3 +245,101 @@ async def test_server_task_cancel_doesnt_hang_ready_future():
     task = server.start(exec_mode="task", port=0)
     task.cancel()
     await asyncio.wait_for(server.ready, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_memory_report():
+    server = get_server("test_memory_report")
+    server.start(exec_mode="task", port=0)
+    assert await server.ready
+
+    server.state.data = "x" * 10000
+    server.context.data = bytearray(10000)
+    server.state.flush()
+
+    report = server.memory_report(top=1)
+    assert report["state"]["top"][0]["key"] == "data"
+    assert report["state"]["top"][0]["serialized"] > 10000
+    assert report["context"]["top"][0]["key"] == "data"
+    assert report["context"]["top"][0]["object"] > 10000
+
+    await asyncio.sleep(0.1)
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_server_exited_lifecycle():
+    server = get_server("test_server_exited_lifecycle")
+    calls = []
+
+    @server.controller.add("on_server_exited")
+    def sync_exit(**_):
+        calls.append("sync")
+
+    @server.controller.add_task("on_server_exited")
+    async def async_exit(**_):
+        await asyncio.sleep(0.01)
+        calls.append("async")
+
+    task = server.start(exec_mode="task", port=0)
+    assert await server.ready
+
+    await server.stop()
+    await task
+    # Synchronous hooks run inline once the server task completes
+    assert calls == ["sync"]
+    await asyncio.sleep(0.1)
+    assert calls == ["sync", "async"]
+
+
+def test_child_server_destroy():
+    server = get_server("test_child_server_destroy")
+    children = [server.create_child_server(prefix=f"tile_{i}_") for i in range(3)]
+    changes = []
+
+    for i, child in enumerate(children):
+        child.state.value = i
+        child.state.setdefault("label", f"tile {i}")
+        child.context.data = [i]
+
+        @child.state.change("value")
+        def on_value(value, **_):
+            changes.append(value)
+
+        child.controller.update = lambda: None
+        child.controller.trigger_name(on_value)
+
+    # Keys set with their full name from the root are indexed too
+    server.state.tile_1_extra = 1
+    server.state.ready()
+
+    child = children[1]
+    assert child.state.namespace_keys() == [
+        "tile_1_value",
+        "tile_1_label",
+        "tile_1_extra",
+    ]
+    assert [name for name, _ in child.state.namespace_listeners()] == ["tile_1_value"]
+    assert len(child.controller.namespace_triggers()) == 1
+    assert child.controller.namespace_functions() == ["tile_1_update"]
+
+    (trigger_name,) = child.controller.namespace_triggers()
+    child.destroy()
+
+    assert "tile_1_value" not in server.state
+    assert "tile_1_extra" not in server.state
+    assert "tile_1_data" not in server.context
+    assert server.state.tile_0_value == 0
+    assert server.state.tile_2_value == 2
+    assert server.controller.trigger_fn(trigger_name) is None
+    assert not server.controller.tile_1_update.exists()
+    assert child.state.namespace_keys() == []
+
+    with server.state:
+        server.state.tile_1_value = 10
+        server.state.tile_2_value = 20
+    assert 20 in changes
+    assert 10 not in changes
+
+    with pytest.raises(RuntimeError, match="child server"):
+        server.destroy()
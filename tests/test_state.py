@@ -762,3 +762,152 @@ def test_child_state_changes_propagated_to_parent_state(fake_server):
 
     mock1.assert_called_once()
     mock2.assert_called_once()
+
+
+def test_memory_usage():
+    state = State(ready=True)
+    child_state = State(Translator(prefix="child_"), internal=state)
+
+    state.small = 1
+    child_state.big = list(range(1000))
+    state.pending = "x" * 100
+    state.clean("pending")
+    state.flush()
+
+    usage = state.memory_usage(top=2)
+    assert usage["count"] == 3
+    assert usage["object"] > usage["serialized"] > 1000
+    assert [entry["key"] for entry in usage["top"]] == ["child_big", "pending"]
+    assert usage["top"][0]["namespace"] == "child_"
+    assert usage["top"][1]["namespace"] == ""
+    assert usage["pending"] == {"count": 0, "object": 0, "serialized": 0}
+
+    # Only modified keys are measured again
+    big_size = usage["top"][0]["object"]
+    state.child_big.extend(range(1000))
+    assert child_state.memory_usage(top=1)["top"][0]["object"] == big_size
+
+    child_state.dirty("big")
+    state.flush()
+    assert child_state.memory_usage(top=1)["top"][0]["object"] > big_size
+
+    # Pending values are reported on the side
+    state.other = 2
+    usage = state.memory_usage()
+    assert usage["pending"]["count"] == 1
+    assert usage["count"] == 3
+    assert [entry["key"] for entry in usage["top"] if entry["pending"]] == ["other"]
+
+    # Serialized sizes can come from an existing cache
+    state.small = 3
+    state.flush()
+    usage = state.memory_usage(serialized_cache={"small": b"12345"})
+    small = next(entry for entry in usage["top"] if entry["key"] == "small")
+    assert small["serialized"] == 5
+
+
+def test_namespace_flush_and_snapshot():
+    pushed = []
+
+    def commit(changes):
+        pushed.append(dict(changes))
+
+    state = State(commit_fn=commit)
+    panel_a = State(Translator(prefix="a_"), internal=state, commit_fn=commit)
+    panel_b = State(Translator(prefix="b_"), internal=state, commit_fn=commit)
+    state.ready()
+
+    on_a = MagicMock()
+    on_b = MagicMock()
+    panel_a.change("value")(on_a)
+    panel_b.change("value")(on_b)
+
+    @panel_a.change("value")
+    def chain(value, **_):
+        panel_a.double = 2 * value
+
+    panel_a.value = 1
+    panel_b.value = 2
+    assert panel_a.snapshot() == {"value": 1}
+
+    panel_a.flush(scope="namespace")
+    on_a.assert_called_once()
+    on_b.assert_not_called()
+    assert pushed == [{"a_value": 1}, {"a_double": 2}]
+    assert state.is_dirty("b_value")
+    assert panel_a.snapshot() == {"value": 1, "double": 2}
+    assert panel_b.snapshot() == {"value": 2}
+    assert state.snapshot()["b_value"] == 2
+
+    state.flush()
+    on_b.assert_called_once()
+    on_a.assert_called_once()
+
+    with pytest.raises(ValueError, match="Invalid flush scope"):
+        panel_a.flush(scope="other")
+
+
+def test_namespace_flush_skips_nested_namespace():
+    pushed = []
+
+    def commit(changes):
+        pushed.append(dict(changes))
+
+    state = State(commit_fn=commit)
+    outer = State(Translator(prefix="a_"), internal=state, commit_fn=commit)
+    nested = State(Translator(prefix="a_b_"), internal=state, commit_fn=commit)
+    state.ready()
+
+    on_nested = MagicMock()
+    nested.change("y")(on_nested)
+
+    outer.x = 1
+    nested.y = 2
+    outer.flush(scope="namespace")
+    assert pushed == [{"a_x": 1}]
+    on_nested.assert_not_called()
+    assert state.is_dirty("a_b_y")
+
+    nested.flush(scope="namespace")
+    assert pushed[1:] == [{"a_b_y": 2}]
+    on_nested.assert_called_once()
+
+
+def test_remove_change_listener(fake_server):
+    state = fake_server.state
+    state.ready()
+    mock = MagicMock()
+    state.change("a", "b")(mock)
+
+    state.remove_change(mock, "a")
+    state.a = 1
+    state.flush()
+    mock.assert_not_called()
+
+    state.b = 1
+    state.flush()
+    mock.assert_called_once()
+
+    state.remove_change(mock)
+    state.b = 2
+    state.flush()
+    mock.assert_called_once()
+
+
+def test_remove_keys(fake_server):
+    state = fake_server.state
+    state.ready()
+    on_change = MagicMock()
+    state.change("a")(on_change)
+
+    state.a = 1
+    state.b = 2
+    state.flush()
+    on_change.reset_mock()
+    version = state.keys_version
+
+    state.remove("a", "missing")
+    assert not state.has("a")
+    assert state.has("b")
+    assert state.keys_version == version + 1
+    on_change.assert_not_called()
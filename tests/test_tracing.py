@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+import pytest
+from trame.app import asynchronous, get_client, get_server
+
+from trame_server.utils import tracing
+
+
+@pytest.fixture
+def exporter():
+    exporter = tracing.enable()
+    try:
+        yield exporter
+    finally:
+        tracing.disable()
+
+
+def test_disabled_by_default():
+    assert not tracing.TRACER.enabled
+    with tracing.span("nothing") as span:
+        span.set_attribute("a", 1)
+        assert tracing.current_span() is None
+
+
+def test_span_hierarchy(exporter):
+    with tracing.span("parent", a=1) as parent:
+        assert tracing.current_span() is parent
+        with tracing.span("child") as child:
+            child.set_attribute("b", 2)
+
+    msg = "boom"
+    with pytest.raises(ValueError, match=msg), tracing.span("failure"):
+        raise ValueError(msg)
+
+    child, parent, failure = exporter.spans
+    assert parent.parent_span_id is None
+    assert child.parent_span_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert failure.trace_id != parent.trace_id
+    assert failure.status == tracing.STATUS_ERROR
+    assert parent.attributes == {"a": 1}
+    assert child.to_dict()["attributes"] == {"b": 2}
+    assert parent.duration >= child.duration
+    assert exporter.trace(parent.trace_id) == [parent, child]
+
+
+def test_json_file_exporter(tmp_path):
+    output = tmp_path / "spans.json"
+    tracing.initialize_tracer({"trace": str(output)})
+    try:
+        with tracing.span("a"), tracing.span("b"):
+            pass
+        (exporter,) = tracing.TRACER.exporters
+        handle = exporter._file
+        with tracing.span("c"):
+            pass
+        assert exporter._file is handle
+    finally:
+        tracing.disable()
+
+    lines = output.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["b", "a", "c"]
+    assert handle.closed
+
+
+@pytest.mark.asyncio
+async def test_trigger_to_publish(exporter):
+    server = get_server("test_trigger_to_publish")
+    server.start(exec_mode="task", port=0)
+    assert await server.ready
+
+    client = get_client(f"ws://localhost:{server.port}/ws")
+    asynchronous.create_task(client.connect(secret="wslink-secret"))
+    for _ in range(10):
+        if client.connected == 2:
+            break
+        await asyncio.sleep(0.1)
+
+    @server.state.change("value")
+    def on_value(value, **_):
+        server.state.double = 2 * value
+
+    @server.controller.set("apply_value")
+    def apply_value(value):
+        server.state.value = value
+
+    server.trigger("set_value")(server.controller.apply_value)
+    exporter.clear()
+
+    assert await client.call_trigger("set_value", [2]) is None
+    assert server.state.double == 4
+
+    (trigger,) = [s for s in exporter.spans if s.name == "trame.trigger"]
+    spans = exporter.trace(trigger.trace_id)
+    by_id = {s.span_id: s for s in spans}
+    names = [s.name for s in spans]
+    assert names[0] == "trame.trigger"
+    for name in [
+        "trame.controller",
+        "trame.state.flush",
+        "trame.state.flush.cycle",
+        "trame.state.change",
+        "trame.state.push",
+        "trame.publish",
+    ]:
+        assert name in names
+
+    for span in spans[1:]:
+        assert span.parent_span_id in by_id
+
+    (change,) = [s for s in spans if s.name == "trame.state.change"]
+    assert change.attributes == {"callback": on_value.__qualname__}
+
+    (publish, *_) = [s for s in spans if s.name == "trame.publish"]
+    assert by_id[publish.parent_span_id].name == "trame.state.push"
+
+    await asyncio.sleep(0.1)
+    await client.disconnect()
+    await server.stop()
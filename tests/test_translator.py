@@ -1,3 +1,4 @@
+import copy
 import logging
 
 from trame_server.core import Controller, State, Translator
@@ -350,3 +351,101 @@ def test_change_callback():
     b_state.flush()
 
     assert test_passed
+
+
+def test_translator_cache():
+    translator = Translator(cache_size=2)
+    assert translator.identity
+    assert translator.translate_dict({"a": 1}) == {"a": 1}
+    assert translator.reverse_translate_list(["a"]) == ["a"]
+
+    translator.set_prefix("p_")
+    assert not translator.identity
+    assert translator.translate_list(["a", "b", "trame__busy"]) == [
+        "p_a",
+        "p_b",
+        "trame__busy",
+    ]
+    assert translator.translate_dict({"a": 1}) == {"p_a": 1}
+    assert len(translator._key_cache) == 2
+
+    # Cache is invalidated when the mapping changes
+    translator.add_translation("a", "shared_a")
+    assert translator.translate_key("a") == "shared_a"
+    assert translator.reverse_translate_key("shared_a") == "a"
+    assert translator.reverse_translate_dict({"shared_a": 1, "p_b": 2, "c": 3}) == {
+        "a": 1,
+        "b": 2,
+    }
+
+    translator.set_prefix("q_")
+    assert translator.translate_key("b") == "q_b"
+    assert translator.reverse_translate_key("q_b") == "b"
+
+
+def test_translator_copy_and_subclass():
+    class UpperTranslator(Translator):
+        def translate_key(self, key):
+            return super().translate_key(key).upper()
+
+    assert UpperTranslator(prefix="p_").translate_key("a") == "P_A"
+
+    translator = Translator(prefix="p_")
+    assert translator.translate_key("a") == "p_a"
+
+    shallow = copy.copy(translator)
+    shallow.set_prefix("s_")
+    assert shallow.translate_key("a") == "s_a"
+    assert shallow.reverse_translate_key("s_a") == "a"
+
+    deep = copy.deepcopy(translator)
+    deep.add_translation("a", "shared_a")
+    assert deep.translate_key("a") == "shared_a"
+
+    assert translator.translate_key("a") == "p_a"
+    assert translator.reverse_translate_key("p_a") == "a"
+
+
+def test_expression_translation():
+    root_state = State()
+    child_state = State(translator=Translator(prefix="child_"), internal=root_state)
+    root_state.ready()
+    child_state.ready()
+    child_state.value = 1
+    child_state.flush()
+
+    translator = child_state.translator
+    has_calls = []
+    has = child_state.has
+
+    def counting_has(key):
+        has_calls.append(key)
+        return has(key)
+
+    child_state.__dict__["has"] = counting_has
+
+    expression = "value + other.length * (value_2 || 'value')"
+    assert (
+        translator.translate_js_expression(child_state, expression)
+        == "child_value + other.length * (value_2 || 'child_value')"
+    )
+    assert (
+        translator.translate_vue_templating(child_state, "v: {{ value }}")
+        == "v: {{ child_value }}"
+    )
+
+    # Cached until a new key is added
+    call_count = len(has_calls)
+    translator.translate_js_expression(child_state, expression)
+    assert len(has_calls) == call_count
+
+    child_state.value = 2
+    translator.translate_js_expression(child_state, expression)
+    assert len(has_calls) == call_count
+
+    child_state.other = {}
+    assert (
+        translator.translate_js_expression(child_state, expression)
+        == "child_value + child_other.length * (value_2 || 'child_value')"
+    )
+    assert len(has_calls) > call_count
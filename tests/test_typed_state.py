@@ -1,17 +1,24 @@
 import asyncio
+import gc
+import weakref
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timezone
 from enum import Enum, auto
 from pathlib import Path
+from typing import Annotated
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
 
 from trame_server import Server
+from trame_server.state import State
+from trame_server.utils import typed_state
 from trame_server.utils.typed_state import (
+    CollectionEncoderDecoder,
     DefaultEncoderDecoder,
     IStateEncoderDecoder,
+    NumericBufferEncoderDecoder,
     TypedState,
 )
 
@@ -563,3 +570,191 @@ def test_can_supress_change_listeners(state):
 
     state.flush()
     mock.assert_not_called()
+
+
+@dataclass
+class TreeNode:
+    name: str
+    kind: MyEnum | None = None
+    children: list["TreeNode"] = field(default_factory=list)
+
+
+def test_encoder_compiles_decoding_plans_once(monkeypatch):
+    encoder = CollectionEncoderDecoder()
+    tree = TreeNode(
+        "root",
+        MyEnum.A,
+        [TreeNode("a", MyEnum.B), TreeNode("b", children=[TreeNode("c")])],
+    )
+
+    encoded = encoder.encode(tree)
+    assert encoded["children"][1]["children"][0] == {
+        "name": "c",
+        "kind": None,
+        "children": [],
+    }
+    assert encoder.decode(encoded, TreeNode) == tree
+
+    # Plans are reused, type hints are not resolved again
+    type_hints = MagicMock()
+    monkeypatch.setattr("trame_server.utils.typed_state.get_type_hints", type_hints)
+    assert encoder.decode(encoded, TreeNode) == tree
+    type_hints.assert_not_called()
+    assert encoder._decode_plan(TreeNode) is encoder._decode_plan(TreeNode)
+
+    # Equal unions with a different member order keep their own decoding order
+    encoder = CollectionEncoderDecoder([CustomEnumEncode()])
+    assert encoder.decode("B_CUSTOM", str | MyEnum) == "B_CUSTOM"
+    assert encoder.decode("B_CUSTOM", MyEnum | str) == MyEnum.B
+
+    with pytest.raises(TypeError, match="Failed to decode"):
+        encoder.decode(["B_CUSTOM", "D"], list[MyEnum])
+
+
+def test_encoder_decoding_plans_stay_bounded(monkeypatch):
+    encoder = CollectionEncoderDecoder()
+    for _ in range(10):
+        # Equal annotations built on each call share the same plan
+        assert encoder.decode(["1", 2], list[int]) == [1, 2]
+        assert encoder.decode({"a": "1"}, dict[str, int | None]) == {"a": 1}
+    assert len(encoder._decode_plans) == 5
+
+    # Plans of unhashable annotations are only kept for the latest ones
+    monkeypatch.setattr(typed_state, "_MAX_UNHASHABLE_DECODE_PLANS", 2)
+    annotations = [Annotated[int, []] for _ in range(4)]
+    plans = [encoder._decode_plan(annotation) for annotation in annotations]
+    assert len(encoder._unhashable_decode_plans) == 2
+    assert encoder._decode_plan(annotations[-1]) is plans[-1]
+
+
+def test_proxy_field_caches_decoded_value(state):
+    typed_state = TypedState(state, DataclassCollections)
+    composite = TypedComposite(SimpleTypes(my_int=1, my_enum=MyEnum.A, my_path=Path()))
+    typed_state.data.nested_list = [composite]
+
+    nested_list = typed_state.data.nested_list
+    assert nested_list == [composite]
+    assert typed_state.data.nested_list is nested_list
+
+    # In place modification flagged as dirty
+    state[typed_state.name.nested_list][0]["simple_types"]["my_int"] = 2
+    state.dirty(typed_state.name.nested_list)
+    assert typed_state.data.nested_list is not nested_list
+    assert typed_state.data.nested_list[0].simple_types.my_int == 2
+
+    # Replaced value
+    state.flush()
+    state[typed_state.name.nested_list] = []
+    assert typed_state.data.nested_list == []
+
+
+def test_set_dataclass_only_updates_modified_keys(state):
+    typed_state = TypedState(state, MyBiggerData)
+    typed_state.set_dataclass(MyBiggerData(my_other_data=MyData(a=1, b=2), c=3))
+    state.flush()
+
+    mock = MagicMock()
+    state.change(typed_state.name.my_other_data.a, typed_state.name.c)(mock)
+
+    typed_state.set_dataclass(MyBiggerData(my_other_data=MyData(a=4, b=2), c=5))
+    assert state.is_dirty_all(typed_state.name.my_other_data.a, typed_state.name.c)
+    assert not state.is_dirty(typed_state.name.my_other_data.b)
+    mock.assert_not_called()
+
+    typed_state.set_dataclass(
+        MyBiggerData(my_other_data=MyData(a=6, b=2), c=5), flush=True
+    )
+    mock.assert_called_once()
+    assert state.modified_keys == {typed_state.name.my_other_data.a, typed_state.name.c}
+    assert typed_state.get_dataclass() == MyBiggerData(MyData(a=6, b=2), c=5)
+
+
+def test_proxies_are_reused_for_same_dataclass_and_namespace(state, child_state):
+    first = TypedState(state, MyBiggerData, namespace="first")
+    same = TypedState(state, MyBiggerData, namespace="first")
+    other = TypedState(state, MyBiggerData, namespace="other")
+
+    assert same.data is first.data
+    assert same.name is first.name
+    assert other.data is not first.data
+    assert other.name.c != first.name.c
+
+    custom = TypedState(
+        state, MyBiggerData, namespace="first", encoders=[CustomEnumEncode()]
+    )
+    assert custom.data is not first.data
+    assert custom.name is first.name
+
+    # Defaults get restored when reusing a proxy
+    child = TypedState(child_state, MyBiggerData)
+    child.data.c = 3
+    child_state.flush()
+    child_state.clear_namespace()
+    assert not child_state.has(child.name.c)
+
+    assert TypedState(child_state, MyBiggerData).data is child.data
+    assert child.data.c == 42.0
+
+
+def test_proxy_cache_does_not_grow_or_retain_state(state):
+    TypedState(state, MyBiggerData)
+    cached = len(typed_state._STATE_PROXIES[state])
+    for _ in range(100):
+        TypedState(state, MyBiggerData)
+        TypedState(state, MyBiggerData, encoders=[CustomEnumEncode()])
+    assert len(typed_state._STATE_PROXIES[state]) == cached
+
+    other_state = State()
+    other_state.ready()
+    typed = TypedState(other_state, MyBiggerData)
+    typed.data.c = 1.0
+    assert other_state in typed_state._STATE_PROXIES
+
+    ref = weakref.ref(other_state)
+    del typed, other_state
+    gc.collect()
+    assert ref() is None
+
+
+@dataclass
+class NumericData:
+    floats: list[float] = field(default_factory=list)
+    ints: tuple[int, ...] = ()
+    names: list[str] = field(default_factory=list)
+
+
+def test_numeric_buffer_encoding(state):
+    typed_state = TypedState(state, NumericData, encoder=NumericBufferEncoderDecoder())
+    typed_state.data.floats = [1.0, 2.5, 3.0]
+    typed_state.data.ints = (1, 2, 2**40)
+    typed_state.data.names = ["a", "b"]
+
+    encoded = state[typed_state.name.floats]
+    assert encoded["shape"] == [3]
+    assert encoded["dtype"].endswith("f8")
+    assert len(encoded["buffer"]) == 3 * 8
+    assert state[typed_state.name.ints]["dtype"].endswith("i8")
+    assert state[typed_state.name.names] == ["a", "b"]
+
+    assert typed_state.data.floats == [1.0, 2.5, 3.0]
+    assert typed_state.data.ints == (1, 2, 2**40)
+    assert typed_state.get_dataclass() == NumericData(
+        [1.0, 2.5, 3.0], (1, 2, 2**40), ["a", "b"]
+    )
+
+    # Int buffers decode as floats and plain lists are still supported
+    state[typed_state.name.floats] = state[typed_state.name.ints]
+    assert typed_state.data.floats == [1.0, 2.0, float(2**40)]
+    state[typed_state.name.ints] = [4, 5]
+    assert typed_state.data.ints == (4, 5)
+
+    # Values which would not round trip exactly keep the regular encoding
+    typed_state.data.ints = (2**64 + 1, 3)
+    assert list(state[typed_state.name.ints]) == [2**64 + 1, 3]
+    assert typed_state.data.ints == (2**64 + 1, 3)
+    typed_state.data.ints = (1, True)
+    assert list(state[typed_state.name.ints]) == [1, True]
+    assert typed_state.data.ints[1] is True
+    typed_state.data.floats = [1, 2.5]
+    assert state[typed_state.name.floats] == [1, 2.5]
+    assert typed_state.data.floats == [1, 2.5]
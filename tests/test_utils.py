@@ -1,5 +1,8 @@
+import ast
 import asyncio
+import importlib.util
 import io
+import time
 from contextlib import redirect_stdout
 
 import pytest
@@ -115,3 +118,134 @@ def test_hot_reload():
     hot_reload.hot_reload(re_eval)
 
     re_eval()
+
+
+def test_hot_reload_cache(tmp_path, monkeypatch):
+    module_path = tmp_path / "hot_module.py"
+    module_path.write_text("OFFSET = 1\n\ndef compute(x):\n    return x + OFFSET\n")
+    spec = importlib.util.spec_from_file_location("hot_module", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    compile_count = []
+    recompile = hot_reload._recompile_function
+
+    def counting_recompile(func):
+        compile_count.append(func.__qualname__)
+        return recompile(func)
+
+    monkeypatch.setattr(hot_reload, "_recompile_function", counting_recompile)
+    monkeypatch.setattr(hot_reload, "SKIP_SITE_PACKAGES", False)
+
+    assert hot_reload.reload(module.compute)(1) == 2
+    assert hot_reload.reload(module.compute)(1) == 2
+    assert len(compile_count) == 1
+
+    # Module globals are still picked up
+    module.OFFSET = 10
+    assert hot_reload.reload(module.compute)(1) == 11
+    assert len(compile_count) == 1
+
+    # File change trigger a new compilation
+    module_path.write_text("OFFSET = 1\n\ndef compute(x):\n    return x * 100\n")
+    assert hot_reload.reload(module.compute)(2) == 200
+    assert len(compile_count) == 2
+
+    hot_reload.clear_cache()
+    hot_reload.reload(module.compute)
+    assert len(compile_count) == 3
+
+
+def test_hot_reload_watcher(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(hot_reload, "SKIP_SITE_PACKAGES", False)
+    module_path = tmp_path / "watched_module.py"
+    module_path.write_text("def compute(x):\n    return x + 1\n")
+    spec = importlib.util.spec_from_file_location("watched_module", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert hot_reload.reload(module.compute)(1) == 2
+
+    events = []
+    watcher = hot_reload.HotReloadWatcher(
+        interval=0.01, callback=lambda *args: events.append(args)
+    )
+    watcher.start()
+    try:
+        # Syntax errors get logged and the previous code is kept
+        module_path.write_text("def compute(x):\n    return x +\n")
+        for _ in range(100):
+            if events:
+                break
+            time.sleep(0.01)
+        ((updated, errors),) = events
+        assert updated == []
+        assert errors[0][0] == str(module_path)
+        assert "Hot reload failed" in caplog.text
+        assert hot_reload.reload(module.compute)(1) == 2
+
+        events.clear()
+        module_path.write_text("def compute(x):\n    return x + 1000\n")
+        for _ in range(100):
+            if events:
+                break
+            time.sleep(0.01)
+        assert events == [([str(module_path)], [])]
+        assert hot_reload.reload(module.compute)(1) == 1001
+    finally:
+        watcher.stop()
+
+    assert not watcher.running
+
+
+def test_hot_reload_watcher_parses_file_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(hot_reload, "SKIP_SITE_PACKAGES", False)
+    module_path = tmp_path / "watched_pair.py"
+    module_path.write_text(
+        "def add(x):\n    return x + 1\n\ndef mul(x):\n    return x * 2\n"
+    )
+    spec = importlib.util.spec_from_file_location("watched_pair", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert hot_reload.reload(module.add)(1) == 2
+    assert hot_reload.reload(module.mul)(1) == 2
+
+    parsed = []
+    parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        parsed.append(source)
+        return parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(hot_reload.ast, "parse", counting_parse)
+    module_path.write_text(
+        "def add(x):\n    return x + 10\n\ndef mul(x):\n    return x * 20\n"
+    )
+    watcher = hot_reload.HotReloadWatcher()
+    assert watcher.check() == ([str(module_path)], [])
+    assert len(parsed) == 1
+    assert hot_reload.reload(module.add)(1) == 11
+    assert hot_reload.reload(module.mul)(1) == 20
+
+
+def test_hot_reload_watcher_missing_function(tmp_path, monkeypatch):
+    monkeypatch.setattr(hot_reload, "SKIP_SITE_PACKAGES", False)
+    module_path = tmp_path / "watched_missing.py"
+    module_path.write_text("def a():\n    return 1\n\ndef b():\n    return 2\n")
+    spec = importlib.util.spec_from_file_location("watched_missing", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert hot_reload.reload(module.a)() == 1
+    assert hot_reload.reload(module.b)() == 2
+
+    # b got deleted while a got edited
+    module_path.write_text("def a():\n    return 10\n")
+    watcher = hot_reload.HotReloadWatcher()
+    updated, errors = watcher.check()
+    assert updated == [str(module_path)]
+    assert [path for path, _ in errors] == [str(module_path)]
+    assert "Failed to find 'b'" in str(errors[0][1])
+    assert (str(module_path), "b") not in hot_reload._COMPILE_CACHE
+    assert hot_reload.reload(module.a)() == 10
+
+    # Nothing left to report until the file changes again
+    assert watcher.check() == ([], [])
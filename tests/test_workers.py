@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from trame_server import Server
+
+
+def square(state, value):
+    state.set_progress(0.5, "halfway")
+    state.partial = value
+    return value * value
+
+
+def wait_for_cancel(state):
+    while not state.cancelled:
+        state.poll(0.05)
+    return state.resolution
+
+
+@pytest.mark.asyncio
+async def test_worker_pool():
+    server = Server(workers=1)
+    server.state.ready()
+    server.state.resolution = 3
+    pool = server.workers
+    try:
+        await _run_jobs(server, pool)
+    finally:
+        pool.shutdown()
+
+
+async def _run_jobs(server, pool):
+    assert pool is server.workers
+    assert pool.max_workers == 1
+
+    await pool.warm_up()
+
+    job = pool.submit(square, 4)
+    assert job.status == "pending"
+    assert await job == 16
+    assert job.done
+    assert server.state.partial == 4
+    assert server.state[job.status_key] == {
+        "status": "done",
+        "progress": 0.5,
+        "message": "halfway",
+    }
+    job.forget()
+    assert not server.state.has(job.status_key)
+    assert job.status is None
+
+    job = pool.submit(wait_for_cancel, keys=["resolution"])
+    # The executor fills its call queue (max_workers + 1) ahead of time
+    handed_over = [pool.submit(square, 5), pool.submit(square, 7)]
+    queued = pool.submit(square, 6)
+    assert pool.jobs == [job, *handed_over, queued]
+    await asyncio.sleep(0.5)
+    assert job.status == "running"
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert queued.status == "cancelled"
+
+    job.cancel()
+    assert await job == 3
+    assert job.status == "cancelled"
+    assert [await j for j in handed_over] == [25, 49]
+    assert pool.jobs == []
+
+    # Status keys get removed once completed for status_ttl
+    pool.status_ttl = 0.1
+    job = pool.submit(square, 2)
+    assert await job == 4
+    assert server.state.has(job.status_key)
+    await asyncio.sleep(0.2)
+    assert not server.state.has(job.status_key)
+
+    await server.controller.on_server_exited.call_async()
+    assert server._workers is None
+
+
+def test_worker_pool_cli(monkeypatch):
+    server = Server()
+
+    # Applications can still define their own --workers option
+    server.cli.add_argument("--workers", type=int)
+    monkeypatch.setenv("TRAME_ARGS", "--workers 8 --trame-workers 2")
+    assert server.cli.parse_known_args()[0].workers == 8
+
+    pool = server.workers
+    try:
+        assert pool.max_workers == 2
+    finally:
+        pool.shutdown()